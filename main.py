@@ -6,17 +6,22 @@ This is the main entry point for the modularized AWS IAM Identity Center
 reporting application.
 
 Usage:
-    python main.py
+    python main.py [--cache-dir DIR] [--cache-ttl SECONDS] [--no-cache]
+                   [--refresh-cache]
     ./main.py
 
 Author: Cyril Feraudet <cyril.feraudet@nuant.com>
 License: GPL v3
 """
 
+import argparse
+import logging
 import signal
 import sys
 
-from src.data_collector import data_collector
+from src.aws_clients import aws_clients
+from src.data_collector import DataCollector
+from src.disk_cache import DEFAULT_CACHE_TTL, DiskCache, default_cache_dir
 from src.report_generators import ReportGenerator
 from src.utils import handle_keyboard_interrupt, validate_aws_credentials
 
@@ -26,8 +31,43 @@ def signal_handler(signum, frame):
     handle_keyboard_interrupt()
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Generate access reports for AWS IAM Identity Center."
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for cached AWS data "
+        "(default: ~/.cache/aws-sso-report/<identity-store-id>)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        help=f"Seconds before cached AWS data is refetched (default: {DEFAULT_CACHE_TTL})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch fresh data from AWS and do not write the cache",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached AWS data but write a fresh cache for later runs",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Main application entry point."""
+    args = parse_args()
+
+    # Progress is logged by the src package; keep third-party INFO noise out
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("src").setLevel(logging.INFO)
+
     # Set up signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -40,7 +80,15 @@ def main():
         sys.exit(1)
 
     try:
+        cache = None
+        if not args.no_cache:
+            cache_dir = args.cache_dir or default_cache_dir(
+                aws_clients.identity_store_id
+            )
+            cache = DiskCache(cache_dir, ttl=args.cache_ttl, refresh=args.refresh_cache)
+
         # Collect data from AWS
+        data_collector = DataCollector(cache=cache)
         user_account_roles, user_summaries = data_collector.collect_all_data()
 
         # Generate reports
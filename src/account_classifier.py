@@ -6,12 +6,29 @@ configurable patterns defined in the account_classification.yaml file.
 """
 
 import os
-from typing import Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 import yaml
 
 from .data_models import AWSAccount
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
+# libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> Dict:
+    """Parse a YAML file; keyed on mtime so edits are picked up."""
+    with open(path, "rb") as file:
+        return yaml.load(file, Loader=YAML_LOADER)  # nosec B506 - safe loader
+
 
 class AccountClassifier:
     """Classifies AWS accounts based on configurable patterns."""
@@ -31,12 +48,71 @@ class AccountClassifier:
         self.default_classification = self.config.get(
             "default_classification", "Unclassified"
         )
+        self._build_matchers()
+
+    def _build_matchers(self):
+        """
+        Compile the include/exclude patterns once so each account name is
+        scanned in a single pass rather than once per pattern.
+
+        With pyahocorasick installed, every pattern goes into one automaton
+        whose payloads record (classification, polarity). Otherwise each
+        classification gets an include and an exclude regex alternation.
+        """
+        classifications = self.config.get("classifications", {})
+        self._classification_names = list(classifications)
+        self._use_automaton = ahocorasick is not None
+        self._automaton = None
+        self._always_hits: Set[Tuple[str, str]] = set()
+        self._rule_patterns: List[Tuple[str, Optional[Pattern], Optional[Pattern]]] = []
+
+        if self._use_automaton:
+            automaton = ahocorasick.Automaton()
+            for classification_name, rules in classifications.items():
+                for polarity in ("include", "exclude"):
+                    for pattern in self._normalized_patterns(rules, polarity):
+                        if not pattern:
+                            # The empty string is in every name
+                            self._always_hits.add((classification_name, polarity))
+                            continue
+                        payload = automaton.get(pattern, None)
+                        if payload is None:
+                            payload = []
+                            automaton.add_word(pattern, payload)
+                        payload.append((classification_name, polarity))
+            if len(automaton):
+                automaton.make_automaton()
+                self._automaton = automaton
+            return
+
+        for classification_name, rules in classifications.items():
+            self._rule_patterns.append(
+                (
+                    classification_name,
+                    self._compile_patterns(self._normalized_patterns(rules, "include")),
+                    self._compile_patterns(self._normalized_patterns(rules, "exclude")),
+                )
+            )
+
+    def _normalized_patterns(self, rules: Dict, polarity: str) -> List[str]:
+        """Return a rule's include or exclude patterns, case-normalized."""
+        patterns = rules.get(polarity, [])
+        if not self.case_sensitive:
+            patterns = [pattern.lower() for pattern in patterns]
+        return patterns
+
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> Optional[Pattern]:
+        """Compile literal patterns into one alternation (None if empty)."""
+        if not patterns:
+            return None
+        return re.compile("|".join(map(re.escape, patterns)))
 
     def _load_config(self) -> Dict:
         """Load the classification configuration from YAML file."""
         try:
-            with open(self.config_path, "r", encoding="utf-8") as file:
-                return yaml.safe_load(file)
+            mtime = os.path.getmtime(self.config_path)
+            return _load_yaml_cached(self.config_path, mtime)
         except FileNotFoundError:
             print(
                 f"Warning: Configuration file {self.config_path} not found. Using empty config."
@@ -60,51 +136,30 @@ class AccountClassifier:
         if not self.case_sensitive:
             account_name = account_name.lower()
 
-        classifications = self.config.get("classifications", {})
-
-        for classification_name, rules in classifications.items():
-            if self._matches_classification(account_name, rules):
-                return classification_name
+        # First classification (in config order) with an include match and
+        # no exclude match wins
+        if self._use_automaton:
+            hits = set(self._always_hits)
+            if self._automaton is not None:
+                for _, payload in self._automaton.iter(account_name):
+                    hits.update(payload)
+            for classification_name in self._classification_names:
+                if (classification_name, "include") in hits and (
+                    classification_name,
+                    "exclude",
+                ) not in hits:
+                    return classification_name
+            return self.default_classification
+
+        for classification_name, include_re, exclude_re in self._rule_patterns:
+            if include_re is None or not include_re.search(account_name):
+                continue
+            if exclude_re is not None and exclude_re.search(account_name):
+                continue
+            return classification_name
 
         return self.default_classification
 
-    def _matches_classification(self, account_name: str, rules: Dict) -> bool:
-        """
-        Check if an account name matches the classification rules.
-
-        Args:
-            account_name: The account name to check (already case-normalized)
-            rules: The classification rules (include/exclude patterns)
-
-        Returns:
-            True if the account matches this classification
-        """
-        include_patterns = rules.get("include", [])
-        exclude_patterns = rules.get("exclude", [])
-
-        # Normalize patterns for case sensitivity
-        if not self.case_sensitive:
-            include_patterns = [pattern.lower() for pattern in include_patterns]
-            exclude_patterns = [pattern.lower() for pattern in exclude_patterns]
-
-        # Check if account name matches any include pattern
-        matches_include = False
-        for pattern in include_patterns:
-            if pattern in account_name:
-                matches_include = True
-                break
-
-        # If no include patterns match, this classification doesn't apply
-        if not matches_include:
-            return False
-
-        # Check if account name matches any exclude pattern
-        for pattern in exclude_patterns:
-            if pattern in account_name:
-                return False
-
-        return True
-
     def classify_accounts(self, accounts: List[AWSAccount]) -> Dict[str, str]:
         """
         Classify multiple AWS accounts.
@@ -8,6 +8,16 @@ required for IAM Identity Center reporting.
 from typing import Any, Dict
 
 import boto3
+from botocore.config import Config
+
+# Shared by every client: sized above the collector's worker count so threads
+# never wait on a connection, with adaptive retries to absorb API throttling
+# and keepalive so pooled connections survive between bursts of calls
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+)
 
 
 class AWSClients:
@@ -26,28 +36,32 @@ class AWSClients:
     def sso_admin(self):
         """Get SSO Admin client."""
         if self._sso_admin is None:
-            self._sso_admin = self.session.client("sso-admin")
+            self._sso_admin = self.session.client("sso-admin", config=CLIENT_CONFIG)
         return self._sso_admin
 
     @property
     def identitystore(self):
         """Get Identity Store client."""
         if self._identitystore is None:
-            self._identitystore = self.session.client("identitystore")
+            self._identitystore = self.session.client(
+                "identitystore", config=CLIENT_CONFIG
+            )
         return self._identitystore
 
     @property
     def organizations(self):
         """Get Organizations client."""
         if self._organizations is None:
-            self._organizations = self.session.client("organizations")
+            self._organizations = self.session.client(
+                "organizations", config=CLIENT_CONFIG
+            )
         return self._organizations
 
     @property
     def cloudtrail(self):
         """Get CloudTrail client."""
         if not hasattr(self, "_cloudtrail") or self._cloudtrail is None:
-            self._cloudtrail = self.session.client("cloudtrail")
+            self._cloudtrail = self.session.client("cloudtrail", config=CLIENT_CONFIG)
         return self._cloudtrail
 
     @property
@@ -5,18 +5,79 @@ This module handles the collection of data from AWS services including
 users, groups, accounts, permission sets, and assignments.
 """
 
-from typing import Dict, List, Set, Tuple
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from .account_classifier import AccountClassifier
 from .aws_clients import aws_clients
-from .data_models import AWSAccount, Role, User, UserAccountRoleGroup, UserSummary
+from .data_models import (
+    AccessLevel,
+    AWSAccount,
+    PermissionScores,
+    Role,
+    User,
+    UserAccountRoleGroup,
+    UserSummary,
+)
+from .disk_cache import DiskCache
 from .permission_analyzer_v2 import permission_analyzer_v2
 
+logger = logging.getLogger(__name__)
+
+# Worker threads used to overlap independent AWS API calls
+MAX_WORKERS = 16
+
+# Number of users between progress messages
+PROGRESS_INTERVAL = 100
+
+# Largest page sizes accepted by the list APIs, to minimize round-trips
+PAGE_SIZE = 100
+ORGANIZATIONS_PAGE_SIZE = 20
+
+# Assignment principal as (PrincipalType, PrincipalId); the account and
+# permission set are already in the assignments key
+Principal = Tuple[str, str]
+
+# Shared stand-in for groups without a membership entry
+_EMPTY_MEMBERS: FrozenSet[str] = frozenset()
+
+# Permission set names rarely change, so each described name is reused for a
+# day even after the listing snapshot expires
+PERMISSION_SET_NAME_TTL = 86400
+
+# Policy analyses are reused for a day as well; --refresh-cache re-analyzes
+PERMISSION_SET_ANALYSIS_TTL = 86400
+
+
+class AssignmentInfo(NamedTuple):
+    """An account-role assignment held by a user, and what granted it."""
+
+    account_id: str
+    role_arn: str
+    responsible_group: str
+    assignment_type: str
+
 
 class DataCollector:
     """Collects data from AWS IAM Identity Center and Organizations."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[DiskCache] = None):
         self.sso_admin = aws_clients.sso_admin
         self.identitystore = aws_clients.identitystore
         self.organizations = aws_clients.organizations
@@ -26,6 +87,9 @@ class DataCollector:
         # Initialize account classifier
         self.account_classifier = AccountClassifier()
 
+        # Optional on-disk snapshots shared between runs
+        self.cache = cache
+
         # Caches
         self._users_cache = None
         self._groups_cache = None
@@ -34,6 +98,15 @@ class DataCollector:
         self._assignments_cache = None
         self._group_memberships_cache = None
 
+        # Users and groups may be requested from several threads at once
+        self._users_lock = threading.Lock()
+        self._groups_lock = threading.Lock()
+
+        # Lookup indexes built once per collection run
+        self._direct_by_user = {}  # user_id -> [(position, account_id, ps_arn)]
+        self._by_group = {}  # group_id -> [(position, account_id, ps_arn)]
+        self._user_to_group_ids = {}  # user_id -> {group_id: group_name}
+
     def collect_all_data(self) -> Tuple[List[UserAccountRoleGroup], List[UserSummary]]:
         """
         Collect all data and return user-account-role assignments and user summaries.
@@ -41,122 +114,150 @@ class DataCollector:
         Returns:
             Tuple of (user_account_roles, user_summaries)
         """
+        user_summaries = []
+        user_account_roles = list(self.iter_user_account_roles(user_summaries))
+        return user_account_roles, user_summaries
+
+    def iter_user_account_roles(
+        self, user_summaries: Optional[List[UserSummary]] = None
+    ) -> Iterator[UserAccountRoleGroup]:
+        """
+        Collect all data and yield user-account-role assignments one at a time.
+
+        Streaming consumers such as the CSV report can write each record as it
+        is produced instead of holding every assignment in memory.
+
+        Args:
+            user_summaries: Optional list that receives each user's summary
+
+        Yields:
+            UserAccountRoleGroup records, grouped by user
+        """
         print("Collecting AWS data...")
 
-        # Load all base data
-        users = self.get_users()
-        accounts = self.get_accounts()
-        permission_sets = self.get_permission_sets()
-        assignments = self.get_assignments()
-        group_memberships = self.get_group_memberships()
+        # Load all base data. The inventories are independent of each other,
+        # so fetch them concurrently instead of one after another.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            users_future = executor.submit(self.get_users)
+            # Memberships load the groups first, then list each group's members
+            memberships_future = executor.submit(self.get_group_memberships)
+            accounts_future = executor.submit(self.get_accounts)
+            permission_sets_future = executor.submit(self.get_permission_sets)
+
+            accounts = accounts_future.result()
+            permission_sets = permission_sets_future.result()
+
+            # Assignments need accounts and permission sets, but can overlap
+            # with the user and membership fetches still in flight
+            assignments = self.get_assignments()
+
+            users = users_future.result()
+            group_memberships = memberships_future.result()
 
         print(
             f"Found {len(users)} users, {len(accounts)} accounts, {len(permission_sets)} permission sets"
         )
 
+        # Index assignments and memberships by principal once, so that
+        # per-user lookups only touch that user's own assignments
+        self._build_indexes(assignments, group_memberships)
+
+        # The JSON view of each role is the same for every user holding it
+        role_json_by_arn = {
+            role_arn: {
+                "name": role.name,
+                "access_level": role.access_level.value,
+                "read_score": role.scores.read_score,
+                "write_score": role.scores.write_score,
+                "admin_score": role.scores.admin_score,
+            }
+            for role_arn, role in permission_sets.items()
+        }
+
+        # Users without assignments all share one placeholder account and role
+        no_account = AWSAccount(id="", name="")
+        no_role = Role(name="", arn="")
+
         # Process each user
-        user_account_roles = []
-        user_summaries = []
 
         for idx, user_data in enumerate(users, 1):
-            # Get user's account-role assignments with responsible groups first
-            temp_user = User(
-                id=user_data["UserId"],
-                username=user_data.get(
-                    "UserName", user_data.get("DisplayName", user_data["UserId"])
-                ),
-                display_name=user_data.get("DisplayName"),
-                groups=self._get_user_groups(user_data["UserId"], group_memberships),
-            )
-
-            user_assignments_with_groups = self._get_user_assignments_with_groups(
-                temp_user, assignments, group_memberships
-            )
-
-            # Infer user status based on assignments
-            user_status = "Enabled" if user_assignments_with_groups else "Disabled"
-
-            # Extract primary email address
-            user_email = self._get_user_primary_email(user_data)
-
-            # Create final user object with inferred status
+            # Build the user once; status is inferred from its assignments
             user = User(
                 id=user_data["UserId"],
                 username=user_data.get(
                     "UserName", user_data.get("DisplayName", user_data["UserId"])
                 ),
                 display_name=user_data.get("DisplayName"),
-                email=user_email,
-                groups=self._get_user_groups(user_data["UserId"], group_memberships),
-                status=user_status,
+                email=self._get_user_primary_email(user_data),
+                groups=self._get_user_groups(user_data["UserId"]),
             )
 
-            print(
-                f"[{idx}/{len(users)}] Processing user: {user.name} (Status: {user.status})"
-            )
+            # Get user's account-role assignments with responsible groups
+            user_assignments_with_groups = self._get_user_assignments_with_groups(user)
+            user.status = "Enabled" if user_assignments_with_groups else "Disabled"
+
+            # Report progress periodically rather than once per user
+            if idx % PROGRESS_INTERVAL == 0 or idx == len(users):
+                logger.info(
+                    "[%d/%d] Processing user: %s (Status: %s)",
+                    idx,
+                    len(users),
+                    user.name,
+                    user.status,
+                )
 
-            # Create UserAccountRoleGroup objects
+            # Create UserAccountRoleGroup objects and, in the same pass, the
+            # JSON structure grouped by account in first-seen order
             aws_accounts_json = []
-            accounts_roles_for_json = {}
+            account_json_by_id = {}
+            seen_account_roles = set()
 
             for assignment_info in user_assignments_with_groups:
-                account = accounts[assignment_info["account_id"]]
-                role = permission_sets[assignment_info["role_arn"]]
+                account = accounts[assignment_info.account_id]
+                role = permission_sets[assignment_info.role_arn]
 
                 # Create UserAccountRoleGroup
                 user_account_role_group = UserAccountRoleGroup(
                     user=user,
                     account=account,
                     role=role,
-                    responsible_group=assignment_info["responsible_group"],
-                    assignment_type=assignment_info["assignment_type"],
+                    responsible_group=assignment_info.responsible_group,
+                    assignment_type=assignment_info.assignment_type,
                 )
-                user_account_roles.append(user_account_role_group)
-
-                # Build JSON structure (grouped by account for JSON export)
-                account_id = assignment_info["account_id"]
-                if account_id not in accounts_roles_for_json:
-                    accounts_roles_for_json[account_id] = {
-                        "account": account,
-                        "roles": {},
-                    }
-
-                role_arn = assignment_info["role_arn"]
-                if role_arn not in accounts_roles_for_json[account_id]["roles"]:
-                    accounts_roles_for_json[account_id]["roles"][role_arn] = {
-                        "name": role.name,
-                        "access_level": role.access_level.value,
-                        "read_score": role.scores.read_score,
-                        "write_score": role.scores.write_score,
-                        "admin_score": role.scores.admin_score,
+                yield user_account_role_group
+
+                account_id = assignment_info.account_id
+                account_json = account_json_by_id.get(account_id)
+                if account_json is None:
+                    account_json = {
+                        "account_name": account.name,
+                        "account_id": account.id,
+                        "roles": [],
                     }
+                    account_json_by_id[account_id] = account_json
+                    aws_accounts_json.append(account_json)
 
-            # Build JSON structure
-            for account_data in accounts_roles_for_json.values():
-                aws_accounts_json.append(
-                    {
-                        "account_name": account_data["account"].name,
-                        "account_id": account_data["account"].id,
-                        "roles": list(account_data["roles"].values()),
-                    }
-                )
+                role_arn = assignment_info.role_arn
+                if (account_id, role_arn) not in seen_account_roles:
+                    seen_account_roles.add((account_id, role_arn))
+                    account_json["roles"].append(role_json_by_arn[role_arn])
 
             # Create user summary for JSON
-            user_summary = UserSummary(user=user, accounts=aws_accounts_json)
-            user_summaries.append(user_summary)
+            if user_summaries is not None:
+                user_summaries.append(
+                    UserSummary(user=user, accounts=aws_accounts_json)
+                )
 
             # Handle users without roles
             if not user_assignments_with_groups:
                 empty_user_account_role_group = UserAccountRoleGroup(
                     user=user,
-                    account=AWSAccount(id="", name=""),
-                    role=Role(name="", arn=""),
+                    account=no_account,
+                    role=no_role,
                     responsible_group="NONE",
                     assignment_type="NONE",
                 )
-                user_account_roles.append(empty_user_account_role_group)
-
-        return user_account_roles, user_summaries
+                yield empty_user_account_role_group
 
     def _get_user_primary_email(self, user_data: Dict) -> str:
         """
@@ -169,70 +270,120 @@ class DataCollector:
             Primary email address or "N/A" if not found
         """
         try:
-            emails = user_data.get("Emails", [])
-
+            emails = user_data.get("Emails") or []
             if not emails:
                 return "N/A"
 
-            # Look for primary email first
-            for email_obj in emails:
-                if email_obj.get("Primary", False):
-                    return email_obj.get("Value", "N/A")
-
-            # If no primary email found, return the first email
-            if emails:
-                return emails[0].get("Value", "N/A")
-
-            return "N/A"
+            # Primary email first, otherwise the first one listed
+            primary = next((email for email in emails if email.get("Primary")), None)
+            return (primary or emails[0]).get("Value", "N/A")
 
         except (KeyError, TypeError, IndexError) as e:
             print(f"Warning: Could not extract email from user data: {e}")
             return "N/A"
 
+    def _load_cached(self, name: str) -> Optional[Any]:
+        """Load a snapshot from the disk cache, if one is configured and fresh."""
+        if self.cache is None:
+            return None
+
+        value = self.cache.load(name)
+        if value is not None:
+            print(f"Using cached {name.replace('_', ' ')}")
+        return value
+
+    def _save_cached(self, name: str, value: Any):
+        """Store a snapshot in the disk cache, if one is configured."""
+        if self.cache is None:
+            return
+
+        try:
+            self.cache.save(name, value)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Could not write {name} to cache: {e}")
+
+    def _load_recent(self, name: str, ttl: float) -> Dict[str, list]:
+        """Load per-ARN cache entries whose trailing timestamp is within ttl."""
+        if self.cache is None:
+            return {}
+
+        now = time.time()
+        cached = self.cache.load(name, ttl=ttl) or {}
+        return {key: entry for key, entry in cached.items() if now - entry[-1] < ttl}
+
+    def _cached(self, name: str, fetch: Callable[[], Any]) -> Any:
+        """Return a JSON snapshot from the disk cache, fetching it on a miss."""
+        value = self._load_cached(name)
+        if value is None:
+            value = fetch()
+            self._save_cached(name, value)
+        return value
+
     def get_users(self) -> List[Dict]:
         """Get all users from Identity Store."""
         if self._users_cache is not None:
             return self._users_cache
 
-        users = []
-        paginator = self.identitystore.get_paginator("list_users")
+        def fetch_users() -> List[Dict]:
+            users = []
+            paginator = self.identitystore.get_paginator("list_users")
 
-        for page in paginator.paginate(IdentityStoreId=self.identity_store_id):
-            users.extend(page["Users"])
+            for page in paginator.paginate(
+                IdentityStoreId=self.identity_store_id,
+                PaginationConfig={"PageSize": PAGE_SIZE},
+            ):
+                users.extend(page["Users"])
 
-        self._users_cache = users
-        return users
+            return users
+
+        with self._users_lock:
+            if self._users_cache is None:
+                self._users_cache = self._cached("users", fetch_users)
+        return self._users_cache
 
     def get_groups(self) -> List[Dict]:
         """Get all groups from Identity Store."""
         if self._groups_cache is not None:
             return self._groups_cache
 
-        groups = []
-        paginator = self.identitystore.get_paginator("list_groups")
+        def fetch_groups() -> List[Dict]:
+            groups = []
+            paginator = self.identitystore.get_paginator("list_groups")
+
+            for page in paginator.paginate(
+                IdentityStoreId=self.identity_store_id,
+                PaginationConfig={"PageSize": PAGE_SIZE},
+            ):
+                groups.extend(page["Groups"])
 
-        for page in paginator.paginate(IdentityStoreId=self.identity_store_id):
-            groups.extend(page["Groups"])
+            return groups
 
-        self._groups_cache = groups
-        return groups
+        with self._groups_lock:
+            if self._groups_cache is None:
+                self._groups_cache = self._cached("groups", fetch_groups)
+        return self._groups_cache
 
     def get_accounts(self) -> Dict[str, AWSAccount]:
         """Get all AWS accounts from Organizations."""
         if self._accounts_cache is not None:
             return self._accounts_cache
 
-        accounts = {}
-        paginator = self.organizations.get_paginator("list_accounts")
-
-        for page in paginator.paginate():
-            for account_data in page["Accounts"]:
-                account = AWSAccount(id=account_data["Id"], name=account_data["Name"])
-                # Classify the account using the account classifier
-                account.classification = self.account_classifier.classify_account(
-                    account
+        def fetch_accounts() -> List[Dict]:
+            paginator = self.organizations.get_paginator("list_accounts")
+            return [
+                {"Id": account_data["Id"], "Name": account_data["Name"]}
+                for page in paginator.paginate(
+                    PaginationConfig={"PageSize": ORGANIZATIONS_PAGE_SIZE}
                 )
-                accounts[account.id] = account
+                for account_data in page["Accounts"]
+            ]
+
+        accounts = {}
+        for account_data in self._cached("accounts", fetch_accounts):
+            account = AWSAccount(id=account_data["Id"], name=account_data["Name"])
+            # Classify the account using the account classifier
+            account.classification = self.account_classifier.classify_account(account)
+            accounts[account.id] = account
 
         self._accounts_cache = accounts
         return accounts
@@ -242,143 +393,409 @@ class DataCollector:
         if self._permission_sets_cache is not None:
             return self._permission_sets_cache
 
-        permission_sets = {}
-        paginator = self.sso_admin.get_paginator("list_permission_sets")
+        ps_names = self._cached("permission_sets", self._fetch_permission_set_names)
 
-        for page in paginator.paginate(InstanceArn=self.instance_arn):
-            for ps_arn in page["PermissionSets"]:
-                # Get permission set details
-                ps_details = self.sso_admin.describe_permission_set(
-                    InstanceArn=self.instance_arn, PermissionSetArn=ps_arn
+        # Reuse recent analyses:
+        # {arn: [access_level, read, write, admin, justification, analyzed_at]}
+        analyses = self._load_recent(
+            "permission_set_analysis", PERMISSION_SET_ANALYSIS_TTL
+        )
+        permission_sets = {}
+        for ps_arn, (level, read, write, admin, justification, _) in analyses.items():
+            if ps_arn in ps_names:
+                permission_sets[ps_arn] = Role(
+                    name=ps_names[ps_arn],
+                    arn=ps_arn,
+                    access_level=AccessLevel(level),
+                    scores=PermissionScores(read, write, admin, justification),
                 )
-                ps_name = ps_details["PermissionSet"]["Name"]
 
-                # Create role with analysis using new scoring system
-                role = permission_analyzer_v2.create_role_from_permission_set(
-                    ps_arn, ps_name
-                )
+        # Resolve the analyzer here so worker threads share a single instance
+        create_role = permission_analyzer_v2.create_role_from_permission_set
+
+        # Analyze the remaining permission sets concurrently
+        missing = [ps_arn for ps_arn in ps_names if ps_arn not in permission_sets]
+        now = time.time()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            roles = executor.map(create_role, missing, map(ps_names.get, missing))
+            for ps_arn, role in zip(missing, roles):
                 permission_sets[ps_arn] = role
+                # Failed analyses come back UNKNOWN and are retried next run
+                if role.access_level is not AccessLevel.UNKNOWN:
+                    scores = role.scores
+                    analyses[ps_arn] = [
+                        role.access_level.value,
+                        scores.read_score,
+                        scores.write_score,
+                        scores.admin_score,
+                        scores.justification,
+                        now,
+                    ]
+
+        if missing:
+            self._save_cached(
+                "permission_set_analysis",
+                {ps_arn: analyses[ps_arn] for ps_arn in ps_names if ps_arn in analyses},
+            )
 
+        # Keep the listing order regardless of which roles came from the cache
+        permission_sets = {ps_arn: permission_sets[ps_arn] for ps_arn in ps_names}
         self._permission_sets_cache = permission_sets
         return permission_sets
 
-    def get_assignments(self) -> Dict[Tuple[str, str], List[Dict]]:
+    def _fetch_permission_set_names(self) -> Dict[str, str]:
+        """Get permission set names keyed by ARN."""
+        paginator = self.sso_admin.get_paginator("list_permission_sets")
+        ps_arns = [
+            ps_arn
+            for page in paginator.paginate(
+                InstanceArn=self.instance_arn,
+                PaginationConfig={"PageSize": PAGE_SIZE},
+            )
+            for ps_arn in page["PermissionSets"]
+        ]
+
+        def describe(ps_arn: str) -> str:
+            ps_details = self.sso_admin.describe_permission_set(
+                InstanceArn=self.instance_arn, PermissionSetArn=ps_arn
+            )
+            return ps_details["PermissionSet"]["Name"]
+
+        # Reuse names described within the last day: {arn: [name, fetched_at]}
+        now = time.time()
+        described = self._load_recent("permission_set_names", PERMISSION_SET_NAME_TTL)
+
+        # Describe the remaining permission sets concurrently
+        missing = [ps_arn for ps_arn in ps_arns if ps_arn not in described]
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for ps_arn, name in zip(missing, executor.map(describe, missing)):
+                described[ps_arn] = [name, now]
+
+        if missing:
+            self._save_cached(
+                "permission_set_names",
+                {ps_arn: described[ps_arn] for ps_arn in ps_arns},
+            )
+
+        return {ps_arn: described[ps_arn][0] for ps_arn in ps_arns}
+
+    def get_assignments(self) -> Dict[Tuple[str, str], List[Principal]]:
         """Get all account assignments."""
         if self._assignments_cache is not None:
             return self._assignments_cache
 
+        # JSON has no tuples, so snapshots are stored as [account, ps, list]
+        cached = self._load_cached("assignment_principals")
+        if cached is not None:
+            self._assignments_cache = {
+                (account_id, ps_arn): [tuple(principal) for principal in principals]
+                for account_id, ps_arn, principals in cached
+            }
+            return self._assignments_cache
+
         assignments = {}
         accounts = self.get_accounts()
         permission_sets = self.get_permission_sets()
 
-        for account_id in accounts.keys():
-            for ps_arn in permission_sets.keys():
-                try:
-                    paginator = self.sso_admin.get_paginator("list_account_assignments")
-
-                    for page in paginator.paginate(
-                        InstanceArn=self.instance_arn,
-                        AccountId=account_id,
-                        PermissionSetArn=ps_arn,
-                    ):
-                        if page["AccountAssignments"]:
-                            key = (account_id, ps_arn)
-                            assignments[key] = page["AccountAssignments"]
-
-                except Exception:  # nosec B112
-                    # Skip if no assignments for this combination
-                    continue
+        # Each (account, permission set) pair is an independent API call, so
+        # fan them out over a thread pool (boto3 clients are thread-safe)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Only query pairs where the permission set is actually provisioned
+            ps_arns = list(permission_sets.keys())
+            provisioned = dict(
+                zip(
+                    ps_arns,
+                    executor.map(self._get_provisioned_account_ids, ps_arns),
+                )
+            )
+            pairs = [
+                (account_id, ps_arn)
+                for account_id in accounts.keys()
+                for ps_arn in ps_arns
+                if provisioned[ps_arn] is None or account_id in provisioned[ps_arn]
+            ]
+
+            # Listing per principal is cheaper when there are fewer users and
+            # groups than provisioned pairs (and the SDK has the API)
+            by_principal = None
+            if hasattr(self.sso_admin, "list_account_assignments_for_principal"):
+                principals = [("USER", user["UserId"]) for user in self.get_users()]
+                principals += [
+                    ("GROUP", group["GroupId"]) for group in self.get_groups()
+                ]
+                if len(principals) < len(pairs):
+                    by_principal = self._get_assignments_by_principal(
+                        executor, principals, pairs
+                    )
 
+            if by_principal is not None:
+                assignments = by_principal
+            else:
+                results = executor.map(
+                    lambda pair: self._fetch_account_assignments(*pair), pairs
+                )
+                for key, account_assignments in zip(pairs, results):
+                    if account_assignments:
+                        # Sorted so row order does not depend on which
+                        # listing strategy the tenant size selected
+                        assignments[key] = sorted(account_assignments)
+
+        self._save_cached(
+            "assignment_principals",
+            [
+                [account_id, ps_arn, account_assignments]
+                for (account_id, ps_arn), account_assignments in assignments.items()
+            ],
+        )
         self._assignments_cache = assignments
         return assignments
 
-    def get_group_memberships(self) -> Dict[str, Set[str]]:
-        """Get all group memberships (group_id -> set of user_ids)."""
-        if self._group_memberships_cache is not None:
-            return self._group_memberships_cache
+    def _get_assignments_by_principal(
+        self,
+        executor: ThreadPoolExecutor,
+        principals: List[Tuple[str, str]],
+        pairs: List[Tuple[str, str]],
+    ) -> Optional[Dict[Tuple[str, str], List[Principal]]]:
+        """
+        Get assignments by listing each user's and group's assignments.
 
-        group_memberships = {}
-        groups = self.get_groups()
+        Args:
+            executor: Pool to run the per-principal calls on
+            principals: (PrincipalType, PrincipalId) tuples to list
+            pairs: (account_id, ps_arn) pairs to keep, in output order
 
-        for group in groups:
-            group_id = group["GroupId"]
-            members = set()
+        Returns:
+            Assignments keyed like the per-pair listing, or None on failure
+        """
+        try:
+            results = list(
+                executor.map(
+                    lambda principal: self._fetch_principal_assignments(*principal),
+                    principals,
+                )
+            )
+        except Exception as e:
+            print(f"Warning: Falling back to per-account assignment listing: {e}")
+            return None
+
+        # An assignment can be reported more than once (e.g. via a user's
+        # groups), but must only produce one principal entry, as in the
+        # per-pair listing
+        collected = defaultdict(set)
+        for principal_assignments in results:
+            for assignment in principal_assignments:
+                key = (assignment["AccountId"], assignment["PermissionSetArn"])
+                principal = (assignment["PrincipalType"], assignment["PrincipalId"])
+                collected[key].add(principal)
+
+        # Keep the pair ordering and only accounts/sets that are known; within
+        # a pair, principals are sorted like the per-pair listing's
+        return {pair: sorted(collected[pair]) for pair in pairs if pair in collected}
+
+    def _fetch_principal_assignments(
+        self, principal_type: str, principal_id: str
+    ) -> List[Dict]:
+        """Get every account assignment held by a single user or group."""
+        paginator = self.sso_admin.get_paginator(
+            "list_account_assignments_for_principal"
+        )
+        return [
+            assignment
+            for page in paginator.paginate(
+                InstanceArn=self.instance_arn,
+                PrincipalId=principal_id,
+                PrincipalType=principal_type,
+                PaginationConfig={"PageSize": PAGE_SIZE},
+            )
+            for assignment in page["AccountAssignments"]
+        ]
+
+    def _get_provisioned_account_ids(self, ps_arn: str) -> Optional[Set[str]]:
+        """
+        Get the accounts a permission set is provisioned to.
+
+        Returns:
+            Set of account IDs, or None if they could not be listed
+        """
+        account_ids = set()
+
+        try:
+            paginator = self.sso_admin.get_paginator(
+                "list_accounts_for_provisioned_permission_set"
+            )
 
-            paginator = self.identitystore.get_paginator("list_group_memberships")
             for page in paginator.paginate(
-                IdentityStoreId=self.identity_store_id, GroupId=group_id
+                InstanceArn=self.instance_arn,
+                PermissionSetArn=ps_arn,
+                PaginationConfig={"PageSize": PAGE_SIZE},
             ):
-                for membership in page["GroupMemberships"]:
-                    member = membership["MemberId"]
-                    if member.get("UserId"):
-                        members.add(member["UserId"])
+                account_ids.update(page["AccountIds"])
+
+        except Exception:
+            # Fall back to querying every account for this permission set
+            return None
+
+        return account_ids
 
-            group_memberships[group_id] = members
+    def _fetch_account_assignments(
+        self, account_id: str, ps_arn: str
+    ) -> List[Principal]:
+        """Get the principals assigned to one (account, permission set) pair."""
+        account_assignments = []
 
+        try:
+            # This is the highest-volume listing, so page by hand rather than
+            # paying the paginator's per-page overhead
+            kwargs = {
+                "InstanceArn": self.instance_arn,
+                "AccountId": account_id,
+                "PermissionSetArn": ps_arn,
+                "MaxResults": PAGE_SIZE,
+            }
+            while True:
+                response = self.sso_admin.list_account_assignments(**kwargs)
+                account_assignments.extend(
+                    (assignment["PrincipalType"], assignment["PrincipalId"])
+                    for assignment in response["AccountAssignments"]
+                )
+
+                next_token = response.get("NextToken")
+                if not next_token:
+                    break
+                kwargs["NextToken"] = next_token
+
+        except Exception:  # nosec B110
+            # Skip if no assignments for this combination
+            pass
+
+        return account_assignments
+
+    def get_group_memberships(self) -> Dict[str, FrozenSet[str]]:
+        """Get all group memberships (group_id -> set of user_ids)."""
+        if self._group_memberships_cache is not None:
+            return self._group_memberships_cache
+
+        cached = self._load_cached("group_memberships")
+        if cached is not None:
+            self._group_memberships_cache = {
+                group_id: frozenset(members) for group_id, members in cached.items()
+            }
+            return self._group_memberships_cache
+
+        group_ids = [group["GroupId"] for group in self.get_groups()]
+
+        # Each group is listed independently, so fan them out over the pool;
+        # the paginator only wraps the operation model and is shared by all
+        paginator = self.identitystore.get_paginator("list_group_memberships")
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            group_memberships = dict(
+                zip(
+                    group_ids,
+                    executor.map(
+                        self._fetch_group_members,
+                        group_ids,
+                        [paginator] * len(group_ids),
+                    ),
+                )
+            )
+
+        self._save_cached(
+            "group_memberships",
+            {
+                group_id: sorted(members)
+                for group_id, members in group_memberships.items()
+            },
+        )
         self._group_memberships_cache = group_memberships
         return group_memberships
 
-    def _get_user_groups(
-        self, user_id: str, group_memberships: Dict[str, Set[str]]
-    ) -> List[str]:
-        """Get groups for a specific user."""
-        user_groups = []
-        groups = self.get_groups()
+    def _fetch_group_members(
+        self, group_id: str, paginator: Any = None
+    ) -> FrozenSet[str]:
+        """Get the user IDs that are members of a single group."""
+        members = set()
 
-        for group in groups:
+        if paginator is None:
+            paginator = self.identitystore.get_paginator("list_group_memberships")
+        for page in paginator.paginate(
+            IdentityStoreId=self.identity_store_id,
+            GroupId=group_id,
+            PaginationConfig={"PageSize": PAGE_SIZE},
+        ):
+            for membership in page["GroupMemberships"]:
+                member = membership["MemberId"]
+                if member.get("UserId"):
+                    members.add(member["UserId"])
+
+        return frozenset(members)
+
+    def _get_user_groups(self, user_id: str) -> List[str]:
+        """Get group names for a specific user from the membership index."""
+        return list(self._user_to_group_ids.get(user_id, {}).values())
+
+    def _build_indexes(
+        self,
+        assignments: Dict[Tuple[str, str], List[Principal]],
+        group_memberships: Dict,
+    ):
+        """Build principal-keyed lookup indexes for assignments and group memberships."""
+        direct_by_user = defaultdict(list)
+        by_group = defaultdict(list)
+
+        # Entries carry their position in ``assignments`` so per-user rows keep
+        # the assignment-key order regardless of which index they come from.
+        position = 0
+        for (account_id, permission_set_arn), assigns in assignments.items():
+            for principal_type, principal_id in assigns:
+                entry = (position, account_id, permission_set_arn)
+                if principal_type == "USER":
+                    direct_by_user[principal_id].append(entry)
+                elif principal_type == "GROUP":
+                    by_group[principal_id].append(entry)
+                position += 1
+
+        user_to_group_ids = defaultdict(dict)
+        for group in self.get_groups():
             group_id = group["GroupId"]
-            if user_id in group_memberships.get(group_id, set()):
-                user_groups.append(group["DisplayName"])
+            for user_id in group_memberships.get(group_id, _EMPTY_MEMBERS):
+                user_to_group_ids[user_id][group_id] = group["DisplayName"]
 
-        return user_groups
+        self._direct_by_user = dict(direct_by_user)
+        self._by_group = dict(by_group)
+        self._user_to_group_ids = dict(user_to_group_ids)
 
-    def _get_user_assignments_with_groups(
-        self, user: User, assignments: Dict, group_memberships: Dict
-    ) -> List[Dict[str, str]]:
+    def _get_user_assignments_with_groups(self, user: User) -> List[AssignmentInfo]:
         """Get account-role assignments for a user with responsible group information."""
         user_assignments = []
 
-        # Get user's group IDs and names mapping
-        user_group_ids = {}  # group_id -> group_name
-        groups = self.get_groups()
-        for group in groups:
-            group_id = group["GroupId"]
-            if user.id in group_memberships.get(group_id, set()):
-                user_group_ids[group_id] = group["DisplayName"]
-
-        # Find assignments (direct and via groups)
-        for (account_id, permission_set_arn), assigns in assignments.items():
-            for assignment in assigns:
-                # Direct user assignment
-                if (
-                    assignment["PrincipalType"] == "USER"
-                    and assignment["PrincipalId"] == user.id
-                ):
-                    user_assignments.append(
-                        {
-                            "account_id": account_id,
-                            "role_arn": permission_set_arn,
-                            "responsible_group": "DIRECT",
-                            "assignment_type": "USER",
-                        }
-                    )
+        # Direct user assignments
+        for position, account_id, permission_set_arn in self._direct_by_user.get(
+            user.id, []
+        ):
+            user_assignments.append(
+                (
+                    position,
+                    AssignmentInfo(account_id, permission_set_arn, "DIRECT", "USER"),
+                )
+            )
 
-                # Group-based assignment
-                elif (
-                    assignment["PrincipalType"] == "GROUP"
-                    and assignment["PrincipalId"] in user_group_ids
-                ):
-                    group_name = user_group_ids[assignment["PrincipalId"]]
-                    user_assignments.append(
-                        {
-                            "account_id": account_id,
-                            "role_arn": permission_set_arn,
-                            "responsible_group": group_name,
-                            "assignment_type": "GROUP",
-                        }
+        # Group-based assignments
+        user_group_ids = self._user_to_group_ids.get(user.id, {})
+        for group_id, group_name in user_group_ids.items():
+            for position, account_id, permission_set_arn in self._by_group.get(
+                group_id, []
+            ):
+                user_assignments.append(
+                    (
+                        position,
+                        AssignmentInfo(
+                            account_id, permission_set_arn, group_name, "GROUP"
+                        ),
                     )
+                )
 
-        return user_assignments
+        user_assignments.sort(key=itemgetter(0))
+        return [assignment for _, assignment in user_assignments]
 
 
 # Global instance for convenience (lazy initialization)
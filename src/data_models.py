@@ -5,9 +5,16 @@ This module defines data classes and structures used throughout the
 IAM Identity Center reporting application.
 """
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Slotted instances are smaller and faster to read; slots= needs Python 3.10
+DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
 
 class AccessLevel(Enum):
@@ -30,7 +37,7 @@ class RiskLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class PermissionScores:
     """Represents permission scores for a role."""
 
@@ -41,19 +48,25 @@ class PermissionScores:
 
     def get_risk_level(self) -> RiskLevel:
         """Calculate risk level based on scores."""
-        if self.admin_score >= 8:
-            return RiskLevel.CRITICAL
-        elif self.admin_score >= 5 or self.write_score >= 8:
-            return RiskLevel.HIGH
-        elif self.write_score >= 5:
-            return RiskLevel.MEDIUM
-        elif self.read_score >= 5:
-            return RiskLevel.LOW
-        else:
-            return RiskLevel.MINIMAL
-
-
-@dataclass
+        return _risk_level_for(self.admin_score, self.write_score, self.read_score)
+
+
+@lru_cache(maxsize=None)
+def _risk_level_for(admin_score: int, write_score: int, read_score: int) -> RiskLevel:
+    """Map scores to a risk level; memoized since few score triples occur."""
+    if admin_score >= 8:
+        return RiskLevel.CRITICAL
+    elif admin_score >= 5 or write_score >= 8:
+        return RiskLevel.HIGH
+    elif write_score >= 5:
+        return RiskLevel.MEDIUM
+    elif read_score >= 5:
+        return RiskLevel.LOW
+    else:
+        return RiskLevel.MINIMAL
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Role:
     """Represents a role (Permission Set) with its analysis."""
 
@@ -72,7 +85,7 @@ class Role:
         return self.scores.get_risk_level()
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AWSAccount:
     """Represents an AWS account."""
 
@@ -84,7 +97,7 @@ class AWSAccount:
         return f"{self.name} ({self.id})"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class User:
     """Represents a user in IAM Identity Center."""
 
@@ -105,7 +118,7 @@ class User:
         return self.display_name or self.username
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class UserAccountRoleGroup:
     """Represents a user-account-role assignment with responsible group."""
 
@@ -117,33 +130,41 @@ class UserAccountRoleGroup:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for CSV/Excel export."""
+        return dict(zip(CSV_FIELDNAMES, self.as_csv_tuple()))
+
+    def as_csv_tuple(self) -> Tuple[Any, ...]:
+        """Get the export fields as a tuple in CSV_FIELDNAMES order."""
+        # Called once per exported row, so resolve each object once
+        user, account, role = self.user, self.account, self.role
+        scores = role.scores
+
         # If user is disabled, override access level to "No access"
         access_level = (
             AccessLevel.NO_ACCESS.value
-            if self.user.status.lower() == "disabled"
-            else self.role.access_level.value
+            if user.status.lower() == "disabled"
+            else role.access_level.value
         )
 
-        return {
-            "User": self.user.name,
-            "User Email": self.user.email,
-            "User Status": self.user.status,
-            "Responsible Group": self.responsible_group or "DIRECT",
-            "Assignment Type": self.assignment_type,
-            "AWS Account": self.account.name,
-            "Account ID": self.account.id,
-            "Account Classification": self.account.classification,
-            "Role Name": self.role.name,
-            "Access Level": access_level,
-            "Read Score": self.role.scores.read_score,
-            "Write Score": self.role.scores.write_score,
-            "Admin Score": self.role.scores.admin_score,
-            "Risk Level": self.role.risk_level.value,
-            "Justification": self.role.scores.justification,
-        }
+        return (
+            user.name,
+            user.email,
+            user.status,
+            self.responsible_group or "DIRECT",
+            self.assignment_type,
+            account.name,
+            account.id,
+            account.classification,
+            role.name,
+            access_level,
+            scores.read_score,
+            scores.write_score,
+            scores.admin_score,
+            scores.get_risk_level().value,
+            scores.justification,
+        )
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class UserSummary:
     """Represents a user summary for JSON export."""
 
@@ -163,7 +184,7 @@ class UserSummary:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class UserAnalysis:
     """Represents a unique user for analysis export."""
 
@@ -192,7 +213,7 @@ class UserAnalysis:
         return result
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AccountAnalysis:
     """Represents an account analysis for export."""
 
@@ -225,7 +246,7 @@ class AccountAnalysis:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class RiskAnalysis:
     """Represents a risk analysis summary."""
 
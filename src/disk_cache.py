@@ -0,0 +1,119 @@
+"""
+Disk Cache
+
+This module persists AWS API snapshots between runs so that repeated report
+generation does not have to enumerate the whole organization again.
+"""
+
+import json
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# Default snapshot lifetime in seconds
+DEFAULT_CACHE_TTL = 3600
+
+
+def default_cache_dir(identity_store_id: str) -> str:
+    """Get the default per-user cache directory for an Identity Store."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "aws-sso-report", identity_store_id)
+
+
+class DiskCache:
+    """Stores JSON snapshots on disk and expires them after a time-to-live."""
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        ttl: float = DEFAULT_CACHE_TTL,
+        refresh: bool = False,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        # When set, existing snapshots are ignored but fresh ones still saved
+        self.refresh = refresh
+
+    def _path(self, name: str) -> Path:
+        return self.cache_dir / f"{name}.json"
+
+    def _check_permissions(self):
+        """
+        Refuse a cache directory that another user could write to.
+
+        Snapshots decide what the audit reports, so a directory planted or
+        writable by someone else must not be read from or written to.
+
+        Raises:
+            PermissionError: If the directory is not owned by the current user
+                or is group or world writable
+        """
+        # Ownership and mode bits are not meaningful on Windows
+        if not hasattr(os, "getuid"):
+            return
+
+        st = self.cache_dir.stat()
+        if st.st_uid != os.getuid():
+            raise PermissionError(
+                f"Cache directory {self.cache_dir} is not owned by the current user"
+            )
+        if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(
+                f"Cache directory {self.cache_dir} is writable by other users"
+            )
+
+    def load(self, name: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Load a snapshot from the cache.
+
+        Args:
+            name: Snapshot name
+            ttl: Lifetime overriding the cache's default, for longer-lived data
+
+        Returns:
+            The cached value, or None if it is missing, expired, unreadable or
+            in a directory other users can write to
+        """
+        if self.refresh:
+            return None
+
+        path = self._path(name)
+
+        try:
+            self._check_permissions()
+
+            if time.time() - path.stat().st_mtime >= (ttl or self.ttl):
+                return None
+
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+    def save(self, name: str, value: Any):
+        """
+        Write a snapshot to the cache atomically.
+
+        Raises:
+            PermissionError: If the cache directory is not private to the user
+        """
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkdir leaves an existing directory's owner and mode untouched
+        self._check_permissions()
+
+        # Write to a temporary file first so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, self._path(name))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
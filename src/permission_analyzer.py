@@ -6,10 +6,56 @@ access levels and calculate permission scores.
 """
 
 import json
-from typing import Tuple
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Tuple
 
 from .aws_clients import aws_clients
 from .data_models import AccessLevel, PermissionScores, Role
+from .utils import json_loads
+
+logger = logging.getLogger(__name__)
+
+# API maximum for list_managed_policies_in_permission_set
+MANAGED_POLICIES_PAGE_SIZE = 100
+
+# Worker threads used by analyze_many to overlap policy fetches
+ANALYSIS_WORKERS = 16
+
+# Permission sets whose analysis is kept in memory
+ANALYSIS_CACHE_SIZE = 4096
+
+# Managed policies that grant administrative access
+ADMIN_POLICY_NAMES = (
+    "AdministratorAccess",
+    "PowerUserAccess",
+    "IAMFullAccess",
+    "OrganizationsFullAccess",
+)
+
+# Each managed policy name is classified with one regex scan per category
+ADMIN_POLICY_RE = re.compile("|".join(map(re.escape, ADMIN_POLICY_NAMES)))
+READ_ONLY_POLICY_RE = re.compile("ReadOnly|ViewOnly")
+
+# Case-insensitive substrings of inline policy actions, by category
+ADMIN_ACTION_KEYWORDS = ("*", "admin", "full", "manage")
+WRITE_ACTION_KEYWORDS = (
+    "create",
+    "delete",
+    "put",
+    "update",
+    "modify",
+    "attach",
+    "detach",
+)
+ADMIN_ACTION_RE = re.compile(
+    "|".join(map(re.escape, ADMIN_ACTION_KEYWORDS)), re.IGNORECASE
+)
+WRITE_ACTION_RE = re.compile(
+    "|".join(map(re.escape, WRITE_ACTION_KEYWORDS)), re.IGNORECASE
+)
 
 
 class PermissionAnalyzer:
@@ -18,7 +64,10 @@ class PermissionAnalyzer:
     def __init__(self):
         self.sso_admin = aws_clients.sso_admin
         self.instance_arn = aws_clients.instance_arn
-        self._cache = {}
+        # Bounded per-ARN results; failures raise, so they are not cached
+        self._analyze_cached = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(
+            self._analyze_uncached
+        )
 
     def analyze_permission_set(
         self, permission_set_arn: str
@@ -29,46 +78,59 @@ class PermissionAnalyzer:
         Returns:
             Tuple of (access_level, permission_scores)
         """
-        if permission_set_arn in self._cache:
-            return self._cache[permission_set_arn]
-
         try:
-            # Get managed policies
-            managed_policies = self._get_managed_policies(permission_set_arn)
-
-            # Get inline policy
-            inline_policy = self._get_inline_policy(permission_set_arn)
-
-            # Analyze policies
-            access_level, scores = self._analyze_policies(
-                managed_policies, inline_policy
+            return self._analyze_cached(permission_set_arn)
+        except Exception as e:
+            logger.warning(
+                "Warning: Could not analyze permissions for %s: %s",
+                permission_set_arn,
+                e,
             )
+            return AccessLevel.UNKNOWN, PermissionScores()
+
+    def _analyze_uncached(
+        self, permission_set_arn: str
+    ) -> Tuple[AccessLevel, PermissionScores]:
+        """Fetch and analyze a Permission Set's policies; errors propagate."""
+        # Get inline policy
+        inline_policy = self._get_inline_policy(permission_set_arn)
+
+        # Analyze policies; managed policy pages are fetched only until an
+        # admin policy settles the outcome
+        return self._analyze_policies(
+            self._iter_managed_policies(permission_set_arn), inline_policy
+        )
 
-            # Cache result
-            result = (access_level, scores)
-            self._cache[permission_set_arn] = result
+    def analyze_many(
+        self, permission_set_arns: Iterable[str]
+    ) -> Dict[str, Tuple[AccessLevel, PermissionScores]]:
+        """
+        Analyze several Permission Sets, fetching their policies concurrently.
 
-            return result
+        Returns:
+            Dict mapping each permission set ARN to (access_level, permission_scores)
+        """
+        # Already-analyzed ARNs are answered from the cache without a fetch
+        arns = list(dict.fromkeys(permission_set_arns))
+        with ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS) as executor:
+            return dict(zip(arns, executor.map(self.analyze_permission_set, arns)))
 
-        except Exception as e:
-            print(
-                f"Warning: Could not analyze permissions for {permission_set_arn}: {e}"
-            )
-            return AccessLevel.UNKNOWN, PermissionScores()
+    def cache_info(self):
+        """Get hit/miss statistics for the per-permission-set analysis cache."""
+        return self._analyze_cached.cache_info()
 
-    def _get_managed_policies(self, permission_set_arn: str) -> list:
-        """Get managed policies attached to a Permission Set."""
-        managed_policies = []
+    def _iter_managed_policies(self, permission_set_arn: str) -> Iterator[dict]:
+        """Yield managed policies attached to a Permission Set, page by page."""
         paginator = self.sso_admin.get_paginator(
             "list_managed_policies_in_permission_set"
         )
 
         for page in paginator.paginate(
-            InstanceArn=self.instance_arn, PermissionSetArn=permission_set_arn
+            InstanceArn=self.instance_arn,
+            PermissionSetArn=permission_set_arn,
+            PaginationConfig={"PageSize": MANAGED_POLICIES_PAGE_SIZE},
         ):
-            managed_policies.extend(page["AttachedManagedPolicies"])
-
-        return managed_policies
+            yield from page["AttachedManagedPolicies"]
 
     def _get_inline_policy(self, permission_set_arn: str) -> str:
         """Get inline policy for a Permission Set."""
@@ -81,7 +143,7 @@ class PermissionAnalyzer:
             return None
 
     def _analyze_policies(
-        self, managed_policies: list, inline_policy: str
+        self, managed_policies: Iterable[dict], inline_policy: str
     ) -> Tuple[AccessLevel, PermissionScores]:
         """Analyze managed and inline policies to determine access level and scores."""
         scores = PermissionScores()
@@ -94,14 +156,7 @@ class PermissionAnalyzer:
             policy_name = policy["Name"]
 
             # Known admin policies
-            admin_policies = [
-                "AdministratorAccess",
-                "PowerUserAccess",
-                "IAMFullAccess",
-                "OrganizationsFullAccess",
-            ]
-
-            if any(admin_policy in policy_name for admin_policy in admin_policies):
+            if ADMIN_POLICY_RE.search(policy_name):
                 has_admin_actions = True
                 scores.admin_score = 10
                 scores.write_score = 10
@@ -109,7 +164,7 @@ class PermissionAnalyzer:
                 break
 
             # Check for read-only policies
-            if "ReadOnly" in policy_name or "ViewOnly" in policy_name:
+            if READ_ONLY_POLICY_RE.search(policy_name):
                 scores.read_score = max(scores.read_score, 8)
                 continue
             else:
@@ -172,7 +227,7 @@ class PermissionAnalyzer:
         has_wildcard_actions = False
 
         try:
-            policy_doc = json.loads(inline_policy)
+            policy_doc = json_loads(inline_policy)
             statements = policy_doc.get("Statement", [])
 
             if isinstance(statements, dict):
@@ -188,23 +243,10 @@ class PermissionAnalyzer:
                         if action == "*" or action.endswith(":*"):
                             has_wildcard_actions = True
                             break
-                        elif any(
-                            admin_action in action.lower()
-                            for admin_action in ["*", "admin", "full", "manage"]
-                        ):
+
+                        if ADMIN_ACTION_RE.search(action):
                             has_admin_actions = True
-                        elif any(
-                            write_action in action.lower()
-                            for write_action in [
-                                "create",
-                                "delete",
-                                "put",
-                                "update",
-                                "modify",
-                                "attach",
-                                "detach",
-                            ]
-                        ):
+                        elif WRITE_ACTION_RE.search(action):
                             has_write_actions = True
 
                     if has_wildcard_actions:
@@ -6,11 +6,28 @@ configuration system for accurate risk assessment and scoring.
 """
 
 import json
-from typing import List, Tuple
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .aws_clients import aws_clients
 from .data_models import AccessLevel, PermissionScores, Role
 from .permission_scoring_config import get_scoring_config
+from .utils import json_loads
+
+logger = logging.getLogger(__name__)
+
+# API maximum for list_managed_policies_in_permission_set
+MANAGED_POLICIES_PAGE_SIZE = 100
+
+# Worker threads used by analyze_many to overlap policy fetches
+ANALYSIS_WORKERS = 16
+
+# Permission sets whose analysis is kept in memory
+ANALYSIS_CACHE_SIZE = 4096
 
 
 class PermissionAnalyzerV2:
@@ -19,7 +36,22 @@ class PermissionAnalyzerV2:
     def __init__(self):
         self.sso_admin = aws_clients.sso_admin
         self.instance_arn = aws_clients.instance_arn
-        self._cache = {}
+        # Raw (managed_policies, inline_policy) per ARN, shared by the summary
+        # and detailed analyses so each permission set is fetched once
+        self._fetch_policies = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(
+            self._fetch_policies_uncached
+        )
+        # Bounded per-ARN results; failures raise, so they are not cached
+        self._analyze_cached = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(
+            self._analyze_uncached
+        )
+        # Bounded analysis results keyed by policy content, shared by
+        # permission sets that attach the same policies
+        self._score_policies = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(
+            self._score_policies_uncached
+        )
+        # Guards the policy cache when permission sets are analyzed concurrently
+        self._lock = threading.Lock()
         self.scoring_config = get_scoring_config()
 
     def analyze_permission_set(
@@ -31,49 +63,89 @@ class PermissionAnalyzerV2:
         Returns:
             Tuple of (access_level, permission_scores)
         """
-        if permission_set_arn in self._cache:
-            return self._cache[permission_set_arn]
-
         try:
-            # Get managed policies
-            managed_policies = self._get_managed_policies(permission_set_arn)
+            return self._analyze_cached(permission_set_arn)
+        except Exception as e:
+            logger.warning(
+                "Warning: Could not analyze permissions for %s: %s",
+                permission_set_arn,
+                e,
+            )
+            return AccessLevel.UNKNOWN, PermissionScores()
 
-            # Get inline policy
-            inline_policy = self._get_inline_policy(permission_set_arn)
+    def _analyze_uncached(
+        self, permission_set_arn: str
+    ) -> Tuple[AccessLevel, PermissionScores]:
+        """Fetch and analyze a Permission Set's policies; errors propagate."""
+        managed_policies, inline_policy = self._fetch_policies(permission_set_arn)
 
-            # Analyze policies using configuration
-            access_level, scores = self._analyze_policies_v2(
-                managed_policies, inline_policy
-            )
+        # Analyze policies using configuration, once per distinct content
+        policy_key = (
+            tuple(policy["Name"] for policy in managed_policies),
+            inline_policy,
+        )
+        # Scoring is CPU-bound, so holding the lock costs no overlap
+        with self._lock:
+            access_level, scores = self._score_policies(*policy_key)
 
-            # Cache result
-            result = (access_level, scores)
-            self._cache[permission_set_arn] = result
+        # Each role gets its own scores object
+        return access_level, copy(scores)
 
-            return result
+    def _score_policies_uncached(
+        self, policy_names: Tuple[str, ...], inline_policy: Optional[str]
+    ) -> Tuple[AccessLevel, PermissionScores]:
+        """Analyze policy content; managed policies are scored by name only."""
+        return self._analyze_policies_v2(
+            [{"Name": name} for name in policy_names], inline_policy
+        )
 
-        except Exception as e:
-            print(
-                f"Warning: Could not analyze permissions for {permission_set_arn}: {e}"
-            )
-            return AccessLevel.UNKNOWN, PermissionScores()
+    def _fetch_policies_uncached(
+        self, permission_set_arn: str
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Fetch a Permission Set's managed policies and inline policy."""
+        return (
+            self._get_managed_policies(permission_set_arn),
+            self._get_inline_policy(permission_set_arn),
+        )
+
+    def analyze_many(
+        self, permission_set_arns: Iterable[str]
+    ) -> Dict[str, Tuple[AccessLevel, PermissionScores]]:
+        """
+        Analyze several Permission Sets, fetching their policies concurrently.
+
+        Returns:
+            Dict mapping each permission set ARN to (access_level, permission_scores)
+        """
+        # Already-analyzed ARNs are answered from the cache without a fetch
+        arns = list(dict.fromkeys(permission_set_arns))
+        with ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS) as executor:
+            return dict(zip(arns, executor.map(self.analyze_permission_set, arns)))
+
+    def cache_info(self):
+        """Get hit/miss statistics for the per-permission-set analysis cache."""
+        return self._analyze_cached.cache_info()
 
     def _get_managed_policies(self, permission_set_arn: str) -> List[dict]:
-        """Get managed policies attached to a Permission Set."""
-        try:
-            paginator = self.sso_admin.get_paginator(
-                "list_managed_policies_in_permission_set"
-            )
-            policies = []
+        """
+        Get managed policies attached to a Permission Set.
 
-            for page in paginator.paginate(
-                InstanceArn=self.instance_arn, PermissionSetArn=permission_set_arn
-            ):
-                policies.extend(page["AttachedManagedPolicies"])
+        Listing errors propagate: scoring only the inline policy would
+        under-report access, so the analysis must fail instead.
+        """
+        paginator = self.sso_admin.get_paginator(
+            "list_managed_policies_in_permission_set"
+        )
+        policies = []
 
-            return policies
-        except Exception:
-            return []
+        for page in paginator.paginate(
+            InstanceArn=self.instance_arn,
+            PermissionSetArn=permission_set_arn,
+            PaginationConfig={"PageSize": MANAGED_POLICIES_PAGE_SIZE},
+        ):
+            policies.extend(page["AttachedManagedPolicies"])
+
+        return policies
 
     def _get_inline_policy(self, permission_set_arn: str) -> str:
         """Get inline policy for a Permission Set."""
@@ -116,8 +188,12 @@ class PermissionAnalyzerV2:
                     f"Managed policy '{policy_name}': read={read_score}, write={write_score}, admin={admin_score}"
                 )
 
-            print(
-                f"Managed policy '{policy_name}': read={read_score}, write={write_score}, admin={admin_score}"
+            logger.debug(
+                "Managed policy '%s': read=%d, write=%d, admin=%d",
+                policy_name,
+                read_score,
+                write_score,
+                admin_score,
             )
 
         # Analyze inline policy
@@ -150,17 +226,17 @@ class PermissionAnalyzerV2:
                     )
 
                 # Update access level (take highest)
-                if inline_access_level.value == "Admin":
+                if inline_access_level is AccessLevel.FULL_ADMIN:
                     access_level = AccessLevel.FULL_ADMIN
                 elif (
-                    inline_access_level.value == "Read Write"
-                    and access_level != AccessLevel.FULL_ADMIN
+                    inline_access_level is AccessLevel.READ_WRITE
+                    and access_level is not AccessLevel.FULL_ADMIN
                 ):
                     access_level = AccessLevel.READ_WRITE
 
                 # Log high-risk actions for monitoring
                 if high_risk_actions:
-                    print(f"High-risk actions detected: {high_risk_actions}")
+                    logger.debug("High-risk actions detected: %s", high_risk_actions)
 
         # If we only have managed policies and no inline policy, generate a basic justification
         if not all_actions and managed_policies:
@@ -274,7 +350,7 @@ class PermissionAnalyzerV2:
         actions = []
 
         try:
-            policy_doc = json.loads(policy_json)
+            policy_doc = json_loads(policy_json)
             statements = policy_doc.get("Statement", [])
 
             if isinstance(statements, dict):
@@ -294,7 +370,7 @@ class PermissionAnalyzerV2:
                     actions.extend(statement_actions)
 
         except (json.JSONDecodeError, KeyError) as e:
-            print(f"Warning: Could not parse inline policy: {e}")
+            logger.warning("Warning: Could not parse inline policy: %s", e)
 
         return actions
 
@@ -314,8 +390,7 @@ class PermissionAnalyzerV2:
     def get_detailed_analysis(self, permission_set_arn: str) -> dict:
         """Get detailed analysis including risk explanations."""
         try:
-            managed_policies = self._get_managed_policies(permission_set_arn)
-            inline_policy = self._get_inline_policy(permission_set_arn)
+            managed_policies, inline_policy = self._fetch_policies(permission_set_arn)
 
             analysis = {
                 "permission_set_arn": permission_set_arn,
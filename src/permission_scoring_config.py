@@ -39,6 +39,10 @@ except ImportError:
                 self.admin_score = admin_score
 
 
+# libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 class PermissionScoringConfig:
     """Manages permission scoring configuration from YAML files."""
 
@@ -59,11 +63,23 @@ class PermissionScoringConfig:
         self._pattern_cache = {}
         self._compile_patterns()
 
+        # Legacy managed policy lists as one alternation per risk level, and
+        # scores per policy name (the same names recur across permission sets)
+        self._managed_policy_patterns = [
+            (risk_level, re.compile("|".join(map(re.escape, policies))))
+            for risk_level, policies in self.config.get("managed_policies", {}).items()
+            if isinstance(policies, list) and policies
+        ]
+        self._managed_policy_scores: Dict[str, Tuple[int, int, int]] = {}
+
+        # Scores per action; the same actions recur across inline policies
+        self._action_scores: Dict[str, Tuple[int, int, int, str, str]] = {}
+
     def _load_config(self) -> Dict:
         """Load configuration from YAML file."""
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            with open(self.config_path, "rb") as f:
+                return yaml.load(f, Loader=YAML_LOADER)  # nosec B506 - safe loader
         except FileNotFoundError:
             print(f"Warning: Configuration file not found at {self.config_path}")
             print("Using default scoring logic.")
@@ -98,11 +114,15 @@ class PermissionScoringConfig:
 
     def _compile_patterns(self):
         """Compile regex patterns for performance."""
+        # One alternation per risk level: only the level decides the score, so
+        # which of its patterns matched does not matter
         patterns = self.config.get("patterns", {})
         for risk_level, pattern_list in patterns.items():
-            self._pattern_cache[risk_level] = [
-                re.compile(pattern, re.IGNORECASE) for pattern in pattern_list
-            ]
+            if pattern_list:
+                self._pattern_cache[risk_level] = re.compile(
+                    "|".join(f"(?:{pattern})" for pattern in pattern_list),
+                    re.IGNORECASE,
+                )
 
     def score_managed_policy(self, policy_name: str) -> Tuple[int, int, int]:
         """
@@ -111,6 +131,14 @@ class PermissionScoringConfig:
         Returns:
             Tuple of (read_score, write_score, admin_score)
         """
+        scores = self._managed_policy_scores.get(policy_name)
+        if scores is None:
+            scores = self._score_managed_policy_uncached(policy_name)
+            self._managed_policy_scores[policy_name] = scores
+        return scores
+
+    def _score_managed_policy_uncached(self, policy_name: str) -> Tuple[int, int, int]:
+        """Score a managed policy by name without consulting the memo."""
         managed_policies = self.config.get("managed_policies", {})
 
         # Check if policy is directly defined in managed_policies
@@ -124,10 +152,8 @@ class PermissionScoringConfig:
 
         # Legacy support: Check old-style risk level lists
         risk_levels = self.config["scoring_rules"]["risk_levels"]
-        for risk_level, policies in managed_policies.items():
-            if isinstance(policies, list) and any(
-                policy in policy_name for policy in policies
-            ):
+        for risk_level, pattern in self._managed_policy_patterns:
+            if pattern.search(policy_name):
                 score = risk_levels.get(risk_level, 5)
 
                 if risk_level == "critical":
@@ -154,6 +180,14 @@ class PermissionScoringConfig:
         Returns:
             Tuple of (read_score, write_score, admin_score, risk_level, justification)
         """
+        scores = self._action_scores.get(action)
+        if scores is None:
+            scores = self._score_action_uncached(action)
+            self._action_scores[action] = scores
+        return scores
+
+    def _score_action_uncached(self, action: str) -> Tuple[int, int, int, str, str]:
+        """Score an individual AWS action without consulting the memo."""
         # Check for special actions first (wildcards, etc.)
         special_actions = self.config.get("special_actions", {})
         if action in special_actions:
@@ -306,49 +340,52 @@ class PermissionScoringConfig:
 
         # Check patterns in order of severity (critical first)
         for risk_level in ["critical", "high", "medium", "low"]:
-            patterns = self._pattern_cache.get(risk_level, [])
-            for pattern in patterns:
-                if pattern.match(action):
-                    base_score = risk_levels.get(risk_level, 5)
-                    weighted_score = int(base_score * weight)
-
-                    # Generate pattern-based justification
-                    justification = f"Pattern-based scoring: Action '{action}' matches {risk_level.upper()} risk pattern. Score: {base_score} (weighted: {weighted_score})"
-
-                    if risk_level == "critical":
-                        justification += ". CRITICAL: Pattern indicates high-risk administrative action."
-                        return (
-                            weighted_score,
-                            weighted_score,
-                            weighted_score,
-                            risk_level,
-                            justification,
-                        )
-                    elif risk_level == "high":
-                        justification += ". HIGH: Pattern indicates significant write/modify permissions."
-                        return (
-                            weighted_score,
-                            weighted_score,
-                            weighted_score // 2,
-                            risk_level,
-                            justification,
-                        )
-                    elif risk_level == "medium":
-                        justification += (
-                            ". MEDIUM: Pattern indicates standard write operations."
-                        )
-                        return (
-                            weighted_score // 2,
-                            weighted_score,
-                            0,
-                            risk_level,
-                            justification,
-                        )
-                    elif risk_level == "low":
-                        justification += (
-                            ". LOW: Pattern indicates read-only operations."
-                        )
-                        return (weighted_score, 0, 0, risk_level, justification)
+            pattern = self._pattern_cache.get(risk_level)
+            if pattern is None or not pattern.match(action):
+                continue
+
+            base_score = risk_levels.get(risk_level, 5)
+            weighted_score = int(base_score * weight)
+
+            # Generate pattern-based justification
+            justification = f"Pattern-based scoring: Action '{action}' matches {risk_level.upper()} risk pattern. Score: {base_score} (weighted: {weighted_score})"
+
+            if risk_level == "critical":
+                justification += (
+                    ". CRITICAL: Pattern indicates high-risk administrative action."
+                )
+                return (
+                    weighted_score,
+                    weighted_score,
+                    weighted_score,
+                    risk_level,
+                    justification,
+                )
+            elif risk_level == "high":
+                justification += (
+                    ". HIGH: Pattern indicates significant write/modify permissions."
+                )
+                return (
+                    weighted_score,
+                    weighted_score,
+                    weighted_score // 2,
+                    risk_level,
+                    justification,
+                )
+            elif risk_level == "medium":
+                justification += (
+                    ". MEDIUM: Pattern indicates standard write operations."
+                )
+                return (
+                    weighted_score // 2,
+                    weighted_score,
+                    0,
+                    risk_level,
+                    justification,
+                )
+            elif risk_level == "low":
+                justification += ". LOW: Pattern indicates read-only operations."
+                return (weighted_score, 0, 0, risk_level, justification)
 
         # Default scoring for unknown actions
         defaults = self.config["scoring_rules"]["defaults"]
@@ -371,21 +408,15 @@ class PermissionScoringConfig:
             Tuple of (access_level, permission_scores, high_risk_actions)
         """
         scores = PermissionScores()
-        high_risk_actions = []
         has_admin = False
         has_write = False
-        justifications = []
-
-        for action in actions:
-            (
-                read_score,
-                write_score,
-                admin_score,
-                risk_level,
-                justification,
-            ) = self.score_action(action)
-            justifications.append(f"{action}: {justification}")
 
+        # Score each distinct action once; repeats cannot change the maxima
+        scored = {
+            action: self.score_action(action) for action in dict.fromkeys(actions)
+        }
+
+        for read_score, write_score, admin_score, _, _ in scored.values():
             # Accumulate scores (take maximum for each category)
             scores.read_score = max(scores.read_score, read_score)
             scores.write_score = max(scores.write_score, write_score)
@@ -397,9 +428,10 @@ class PermissionScoringConfig:
             if write_score > 0:
                 has_write = True
 
-            # Track high-risk actions
-            if risk_level in ["critical", "high"]:
-                high_risk_actions.append(action)
+        # Track high-risk actions
+        high_risk_actions = [
+            action for action in actions if scored[action][3] in ("critical", "high")
+        ]
 
         # Determine access level
         if has_admin or scores.admin_score >= 5:
@@ -411,16 +443,17 @@ class PermissionScoringConfig:
         else:
             access_level = AccessLevel.UNKNOWN
 
-        # Combine all justifications into a comprehensive explanation
+        # Combine the first justifications into a comprehensive explanation
+        justifications = [f"{action}: {scored[action][4]}" for action in actions[:5]]
         scores.justification = (
             f"Analysis of {len(actions)} actions. Access level: {access_level.value}. "
             + f"High-risk actions: {len(high_risk_actions)}. "
             + "Detailed breakdown: "
-            + "; ".join(justifications[:5])
+            + "; ".join(justifications)
         )  # Limit to first 5 for readability
 
-        if len(justifications) > 5:
-            scores.justification += f" ... and {len(justifications) - 5} more actions."
+        if len(actions) > 5:
+            scores.justification += f" ... and {len(actions) - 5} more actions."
 
         return access_level, scores, high_risk_actions
 
@@ -7,14 +7,21 @@ from the collected IAM Identity Center data.
 
 import csv
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Set, Tuple
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-import pandas as pd
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .data_models import (
     ACCOUNT_ANALYSIS_CSV_FIELDNAMES,
     ANALYSIS_CSV_BASE_FIELDNAMES,
@@ -29,6 +36,24 @@ from .data_models import (
     UserSummary,
 )
 
+# Shared Excel styles
+EXCEL_HEADER_FONT = Font(bold=True, color="FFFFFF")
+EXCEL_HEADER_FILL = PatternFill(
+    start_color="4472C4", end_color="4472C4", fill_type="solid"
+)
+EXCEL_WRAP_ALIGNMENT = Alignment(wrapText=True)
+
+# Characters that must be escaped in HTML cell text
+HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _encode_json(value: Any) -> bytes:
+    """Encode a value as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        # Same layout as json.dumps(indent=2, ensure_ascii=False), but faster
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 class ReportGenerator:
     """Generates reports in multiple formats."""
@@ -45,50 +70,64 @@ class ReportGenerator:
         """Generate all report formats."""
         print("Generating reports...")
 
-        self.generate_csv_report(user_account_roles)
-        self.generate_excel_report(user_account_roles)
-        self.generate_html_report(user_account_roles)
-        self.generate_json_report(user_summaries)
-        self.generate_analysis_csv_report(user_account_roles)
-        self.generate_accounts_csv_report(user_account_roles)
-        self.generate_risk_analysis_csv_report(user_account_roles)
+        # The CSV, Excel and HTML data tables share one set of row tuples
+        rows = [uar.as_csv_tuple() for uar in user_account_roles]
+
+        writers = [
+            (partial(self.generate_csv_report, rows=rows), user_account_roles),
+            (partial(self.generate_excel_report, rows=rows), user_account_roles),
+            (partial(self.generate_html_report, rows=rows), user_account_roles),
+            (self.generate_json_report, user_summaries),
+            (self.generate_analysis_csv_report, user_account_roles),
+            (self.generate_accounts_csv_report, user_account_roles),
+            (self.generate_risk_analysis_csv_report, user_account_roles),
+        ]
+
+        # Each writer only reads the collected data and owns its output file,
+        # so they can overlap their file I/O instead of running back to back
+        with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+            futures = [executor.submit(writer, data) for writer, data in writers]
+            for future in futures:
+                future.result()
 
         self._print_completion_summary()
 
-    def generate_csv_report(self, user_account_roles: List[UserAccountRoleGroup]):
-        """Generate CSV report."""
+    def generate_csv_report(
+        self,
+        user_account_roles: Iterable[UserAccountRoleGroup],
+        *,
+        rows: Optional[Iterable[Sequence[Any]]] = None,
+    ):
+        """Generate CSV report, consuming the records in a single pass."""
         filename = f"{self.output_prefix}.csv"
 
-        with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
-            writer.writeheader()
+        if rows is None:
+            # Rows come out in column order, so no dict is built per record
+            rows = (uar.as_csv_tuple() for uar in user_account_roles)
 
-            for uar in user_account_roles:
-                row = uar.to_dict()
-                # Filter only CSV fields
-                csv_row = {k: v for k, v in row.items() if k in CSV_FIELDNAMES}
-                writer.writerow(csv_row)
+        with open(filename, "w", newline="", encoding="utf-8") as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(rows)
 
         print(f"CSV file {filename} generated.")
 
-    def generate_excel_report(self, user_account_roles: List[UserAccountRoleGroup]):
+    def generate_excel_report(
+        self,
+        user_account_roles: List[UserAccountRoleGroup],
+        *,
+        rows: Optional[List[Sequence[Any]]] = None,
+    ):
         """Generate Excel report with formatting and multiple analysis tabs."""
         filename = f"{self.output_prefix}.xlsx"
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Data"  # Renamed from "IAM Identity Center" to "Data"
+        # Write-only mode streams rows to disk instead of keeping every cell
+        wb = Workbook(write_only=True)
 
-        # Add headers
-        ws.append(CSV_FIELDNAMES)
+        if rows is None:
+            rows = [uar.as_csv_tuple() for uar in user_account_roles]
 
-        # Add data rows
-        for uar in user_account_roles:
-            row_data = uar.to_dict()
-            ws.append([row_data.get(col, "") for col in CSV_FIELDNAMES])
-
-        # Apply formatting
-        self._format_excel_worksheet(ws)
+        self._write_excel_worksheet(wb, "Data", CSV_FIELDNAMES, rows)
 
         # Add analysis tabs
         self._add_users_analysis_worksheet(
@@ -101,7 +140,12 @@ class ReportGenerator:
         wb.save(filename)
         print(f"XLSX file {filename} generated with multiple analysis tabs.")
 
-    def generate_html_report(self, user_account_roles: List[UserAccountRoleGroup]):
+    def generate_html_report(
+        self,
+        user_account_roles: List[UserAccountRoleGroup],
+        *,
+        rows: Optional[List[Sequence[Any]]] = None,
+    ):
         """Generate interactive multi-tab HTML report mirroring Excel structure."""
         filename = f"{self.output_prefix}.html"
 
@@ -113,7 +157,9 @@ class ReportGenerator:
         risk_analyses = self._extract_risk_analyses(user_account_roles)
 
         # Generate HTML content for each tab
-        data_html = self._generate_data_table_html(user_account_roles)
+        if rows is None:
+            rows = [uar.as_csv_tuple() for uar in user_account_roles]
+        data_html = self._render_html_rows(rows, CSV_FIELDNAMES)
         users_html = self._generate_users_table_html(unique_users, classifications)
         accounts_html = self._generate_accounts_table_html(account_analyses)
         risk_html = self._generate_risk_table_html(risk_analyses)
@@ -360,121 +406,91 @@ class ReportGenerator:
 
         print(f"Multi-tab HTML file {filename} generated.")
 
-    def _generate_data_table_html(
-        self, user_account_roles: List[UserAccountRoleGroup]
-    ) -> str:
-        """Generate HTML table for the main data tab."""
-        # Prepare data for HTML
-        html_rows = []
-        for uar in user_account_roles:
-            row_data = uar.to_dict()
-            html_row = {}
-
-            for col in CSV_FIELDNAMES:
-                val = row_data.get(col, "")
-                if isinstance(val, str):
-                    html_row[col] = val.replace("\n", "<br>")
-                else:
-                    html_row[col] = val
-
-            html_rows.append(html_row)
-
-        # Create DataFrame and generate HTML table
-        df = pd.DataFrame(html_rows, columns=CSV_FIELDNAMES)
-        return df.to_html(index=False, escape=False, classes="display nowrap", border=0)
-
     def _generate_users_table_html(
         self, unique_users: List[UserAnalysis], classifications: Set[str]
     ) -> str:
         """Generate HTML table for the users analysis tab."""
-        fieldnames = ANALYSIS_CSV_BASE_FIELDNAMES + sorted(classifications)
+        sorted_classifications = sorted(classifications)
+        fieldnames = ANALYSIS_CSV_BASE_FIELDNAMES + sorted_classifications
 
-        html_rows = []
-        for user_analysis in unique_users:
-            row_data = user_analysis.to_dict(classifications=sorted(classifications))
-            html_rows.append(row_data)
-
-        df = pd.DataFrame(html_rows, columns=fieldnames)
-        return df.to_html(index=False, escape=False, classes="display nowrap", border=0)
+        rows = [
+            user_analysis.to_dict(classifications=sorted_classifications)
+            for user_analysis in unique_users
+        ]
+        return self._render_html_table(rows, fieldnames)
 
     def _generate_accounts_table_html(
         self, account_analyses: List[AccountAnalysis]
     ) -> str:
         """Generate HTML table for the accounts analysis tab."""
-        html_rows = []
-        for account_analysis in account_analyses:
-            row_data = account_analysis.to_dict()
-            # Convert email lists to HTML-friendly format
-            for key in ["Admin Emails", "Read Write Emails", "Read Only Emails"]:
-                if row_data[key]:
-                    # Replace semicolons with line breaks for better HTML display
-                    row_data[key] = row_data[key].replace("; ", "<br>")
-            html_rows.append(row_data)
-
-        df = pd.DataFrame(html_rows, columns=ACCOUNT_ANALYSIS_CSV_FIELDNAMES)
-        return df.to_html(index=False, escape=False, classes="display nowrap", border=0)
+        rows = [account_analysis.to_dict() for account_analysis in account_analyses]
+        # Show one email per line for better HTML display
+        return self._render_html_table(
+            rows,
+            ACCOUNT_ANALYSIS_CSV_FIELDNAMES,
+            line_break_columns=[
+                "Admin Emails",
+                "Read Write Emails",
+                "Read Only Emails",
+            ],
+        )
 
     def _generate_risk_table_html(self, risk_analyses: List[RiskAnalysis]) -> str:
         """Generate HTML table for the risk analysis tab."""
-        html_rows = []
-        for risk_analysis in risk_analyses:
-            html_rows.append(risk_analysis.to_dict())
-
-        df = pd.DataFrame(html_rows, columns=RISK_ANALYSIS_CSV_FIELDNAMES)
-        return df.to_html(index=False, escape=False, classes="display nowrap", border=0)
+        rows = [risk_analysis.to_dict() for risk_analysis in risk_analyses]
+        return self._render_html_table(rows, RISK_ANALYSIS_CSV_FIELDNAMES)
 
-    def _generate_summary_html(
-        self, user_account_roles: List[UserAccountRoleGroup]
+    def _render_html_table(
+        self,
+        rows: List[Dict],
+        fieldnames: List[str],
+        line_break_columns: Optional[List[str]] = None,
     ) -> str:
-        """Generate HTML content for the summary tab."""
-        # Calculate summary metrics
-        total_users = len(set(uar.user.username for uar in user_account_roles))
-        total_accounts = len(set(uar.account.id for uar in user_account_roles))
-        total_roles = len(set(uar.role.name for uar in user_account_roles))
-
-        # Count by access level (active users only)
-        admin_count = len(
-            [
-                uar
-                for uar in user_account_roles
-                if uar.role.access_level == AccessLevel.FULL_ADMIN
-                and uar.user.status.lower() != "disabled"
-            ]
-        )
-        read_write_count = len(
-            [
-                uar
-                for uar in user_account_roles
-                if uar.role.access_level == AccessLevel.READ_WRITE
-                and uar.user.status.lower() != "disabled"
-            ]
+        """Render rows as an HTML table with escaped cell text."""
+        return self._render_html_rows(
+            ([row.get(col, "") for col in fieldnames] for row in rows),
+            fieldnames,
+            line_break_columns,
         )
-        read_only_count = len(
-            [
-                uar
-                for uar in user_account_roles
-                if uar.role.access_level == AccessLevel.READ_ONLY
-                and uar.user.status.lower() != "disabled"
-            ]
+
+    def _render_html_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        fieldnames: List[str],
+        line_break_columns: Optional[List[str]] = None,
+    ) -> str:
+        """Render rows of values in fieldnames order as an HTML table."""
+        line_break_columns = set(line_break_columns or ())
+        breaks = [col in line_break_columns for col in fieldnames]
+
+        header = "".join(
+            f"<th>{name.translate(HTML_ESCAPE_TABLE)}</th>" for name in fieldnames
         )
 
-        # Count by risk level (active users only)
-        high_risk_count = len(
-            [
-                uar
-                for uar in user_account_roles
-                if uar.role.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]
-                and uar.user.status.lower() != "disabled"
-            ]
+        body_rows = []
+        for row in rows:
+            cells = []
+            for value, line_break in zip(row, breaks):
+                text = "" if value is None else str(value).translate(HTML_ESCAPE_TABLE)
+                text = text.replace("\n", "<br>")
+                if line_break:
+                    text = text.replace("; ", "<br>")
+                cells.append(f"<td>{text}</td>")
+            body_rows.append(f"<tr>{''.join(cells)}</tr>")
+
+        body = "\n".join(body_rows)
+        return (
+            '<table class="display nowrap">\n'
+            f"<thead>\n<tr>{header}</tr>\n</thead>\n"
+            f"<tbody>\n{body}\n</tbody>\n"
+            "</table>"
         )
 
-        # Count by classification
-        classifications = {}
-        for uar in user_account_roles:
-            classification = uar.account.classification
-            if classification not in classifications:
-                classifications[classification] = set()
-            classifications[classification].add(uar.user.username)
+    def _generate_summary_html(
+        self, user_account_roles: List[UserAccountRoleGroup]
+    ) -> str:
+        """Generate HTML content for the summary tab."""
+        metrics = self._compute_summary_metrics(user_account_roles)
 
         # Generate summary HTML
         summary_html = f"""
@@ -483,15 +499,15 @@ class ReportGenerator:
                 <h3>Overall Statistics</h3>
                 <div class="summary-item">
                     <span class="summary-label">Total Users:</span>
-                    <span class="summary-value">{total_users}</span>
+                    <span class="summary-value">{metrics["total_users"]}</span>
                 </div>
                 <div class="summary-item">
                     <span class="summary-label">Total Accounts:</span>
-                    <span class="summary-value">{total_accounts}</span>
+                    <span class="summary-value">{metrics["total_accounts"]}</span>
                 </div>
                 <div class="summary-item">
                     <span class="summary-label">Total Roles:</span>
-                    <span class="summary-value">{total_roles}</span>
+                    <span class="summary-value">{metrics["total_roles"]}</span>
                 </div>
             </div>
 
@@ -499,15 +515,15 @@ class ReportGenerator:
                 <h3>Access Level Distribution</h3>
                 <div class="summary-item">
                     <span class="summary-label">Admin Users:</span>
-                    <span class="summary-value">{admin_count}</span>
+                    <span class="summary-value">{metrics["admin_count"]}</span>
                 </div>
                 <div class="summary-item">
                     <span class="summary-label">Read Write Users:</span>
-                    <span class="summary-value">{read_write_count}</span>
+                    <span class="summary-value">{metrics["read_write_count"]}</span>
                 </div>
                 <div class="summary-item">
                     <span class="summary-label">Read Only Users:</span>
-                    <span class="summary-value">{read_only_count}</span>
+                    <span class="summary-value">{metrics["read_only_count"]}</span>
                 </div>
             </div>
 
@@ -515,7 +531,7 @@ class ReportGenerator:
                 <h3>Risk Analysis</h3>
                 <div class="summary-item">
                     <span class="summary-label">High/Critical Risk Users:</span>
-                    <span class="summary-value">{high_risk_count}</span>
+                    <span class="summary-value">{metrics["high_risk_count"]}</span>
                 </div>
             </div>
 
@@ -523,11 +539,11 @@ class ReportGenerator:
                 <h3>Users by Classification</h3>
         """
 
-        for classification, users in sorted(classifications.items()):
+        for classification, user_count in metrics["users_by_classification"]:
             summary_html += f"""
                 <div class="summary-item">
                     <span class="summary-label">{classification}:</span>
-                    <span class="summary-value">{len(users)}</span>
+                    <span class="summary-value">{user_count}</span>
                 </div>
             """
 
@@ -542,49 +558,59 @@ class ReportGenerator:
         """Generate JSON report."""
         filename = f"{self.output_prefix}.json"
 
-        json_data = [summary.to_dict() for summary in user_summaries]
-
-        with open(filename, "w", encoding="utf-8") as jf:
-            json.dump(json_data, jf, ensure_ascii=False, indent=2)
+        # Stream one user at a time instead of serializing the whole list.
+        # The layout matches json.dump(indent=2): elements sit one level deep.
+        with open(filename, "wb") as jf:
+            jf.write(b"[")
+            for idx, summary in enumerate(user_summaries):
+                jf.write(b",\n  " if idx else b"\n  ")
+                jf.write(_encode_json(summary.to_dict()).replace(b"\n", b"\n  "))
+            jf.write(b"\n]" if user_summaries else b"]")
 
         print(f"JSON file {filename} generated.")
 
-    def _format_excel_worksheet(self, ws):
-        """Apply formatting to Excel worksheet."""
-        # Header formatting
-        header_fill = PatternFill(
-            start_color="4472C4", end_color="4472C4", fill_type="solid"
-        )
-
-        for cell in ws[1]:
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = header_fill
-
-        # Auto-width columns and wrap text
-        for col_idx, col in enumerate(CSV_FIELDNAMES, 1):
-            max_length = len(col)
-
-            for row_cells in ws.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx):
-                for cell in row_cells:
-                    if cell.value:
-                        cell_length = len(str(cell.value))
-                        if cell_length > max_length:
-                            max_length = cell_length
-
-                    # Enable text wrapping
-                    try:
-                        cell.alignment = cell.alignment.copy(wrapText=True)
-                    except AttributeError:
-                        from openpyxl.styles import Alignment
-
-                        cell.alignment = Alignment(wrapText=True)
-
+    def _write_excel_worksheet(
+        self, workbook: Workbook, title: str, fieldnames: List[str], rows: List[list]
+    ):
+        """Write a formatted worksheet into a write-only workbook."""
+        ws = workbook.create_sheet(title=title)
+
+        # Column widths and panes must be set before the first row is written.
+        # Cells wrap, so a column only needs to fit its longest line.
+        widths = [len(str(name)) for name in fieldnames]
+        for row in rows:
+            for col_idx, value in enumerate(row):
+                if value:
+                    longest = max(map(len, str(value).split("\n")))
+                    if longest > widths[col_idx]:
+                        widths[col_idx] = longest
+
+        for col_idx, width in enumerate(widths, 1):
             # Set column width (max 50 characters)
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, 50)
 
         # Freeze panes (first row and first column)
-        ws.freeze_panes = ws.cell(row=2, column=2)
+        ws.freeze_panes = "B2"
+
+        # Header formatting
+        header_cells = []
+        for name in fieldnames:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.font = EXCEL_HEADER_FONT
+            cell.fill = EXCEL_HEADER_FILL
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Data rows with text wrapping enabled
+        for row in rows:
+            cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.alignment = EXCEL_WRAP_ALIGNMENT
+                cells.append(cell)
+            ws.append(cells)
+
+        return ws
 
     def _create_html_template(self, html_table: str) -> str:
         """Create complete HTML template with DataTables."""
@@ -670,17 +696,18 @@ $(document).ready(function() {{
             user_account_roles
         )
 
-        # Build dynamic fieldnames
-        fieldnames = ANALYSIS_CSV_BASE_FIELDNAMES + sorted(classifications)
+        # Build dynamic fieldnames (sort classifications once, not per user)
+        sorted_classifications = sorted(classifications)
+        fieldnames = ANALYSIS_CSV_BASE_FIELDNAMES + sorted_classifications
 
         with open(filename, "w", newline="", encoding="utf-8") as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
 
-            for user_analysis in unique_users:
-                writer.writerow(
-                    user_analysis.to_dict(classifications=sorted(classifications))
-                )
+            writer.writerows(
+                user_analysis.to_dict(classifications=sorted_classifications)
+                for user_analysis in unique_users
+            )
 
         print(
             f"Analysis CSV file {filename} generated with {len(unique_users)} unique users across {len(classifications)} account types."
@@ -690,27 +717,21 @@ $(document).ready(function() {{
         self, workbook: Workbook, user_account_roles: List[UserAccountRoleGroup]
     ):
         """Add the 'Users' worksheet with unique users and access levels per account type."""
-        # Create new worksheet
-        ws_analysis = workbook.create_sheet(title="Users")
-
         # Extract unique users with access levels per classification
         unique_users, classifications = self._extract_unique_users_with_access(
             user_account_roles
         )
 
-        # Build dynamic fieldnames
-        fieldnames = ANALYSIS_CSV_BASE_FIELDNAMES + sorted(classifications)
+        # Build dynamic fieldnames (sort classifications once, not per user)
+        sorted_classifications = sorted(classifications)
+        fieldnames = ANALYSIS_CSV_BASE_FIELDNAMES + sorted_classifications
 
-        # Add headers
-        ws_analysis.append(fieldnames)
-
-        # Add data rows
+        rows = []
         for user_analysis in unique_users:
-            row_data = user_analysis.to_dict(classifications=sorted(classifications))
-            ws_analysis.append([row_data.get(col, "") for col in fieldnames])
+            row_data = user_analysis.to_dict(classifications=sorted_classifications)
+            rows.append([row_data.get(col, "") for col in fieldnames])
 
-        # Apply formatting
-        self._format_excel_worksheet(ws_analysis)
+        self._write_excel_worksheet(workbook, "Users", fieldnames, rows)
 
         print(
             f"Added 'Users' worksheet with {len(unique_users)} unique users across {len(classifications)} account types."
@@ -729,8 +750,9 @@ $(document).ready(function() {{
             writer = csv.DictWriter(csvfile, fieldnames=ACCOUNT_ANALYSIS_CSV_FIELDNAMES)
             writer.writeheader()
 
-            for account_analysis in account_analyses:
-                writer.writerow(account_analysis.to_dict())
+            writer.writerows(
+                account_analysis.to_dict() for account_analysis in account_analyses
+            )
 
         print(
             f"Accounts CSV file {filename} generated with {len(account_analyses)} accounts."
@@ -749,8 +771,7 @@ $(document).ready(function() {{
             writer = csv.DictWriter(csvfile, fieldnames=RISK_ANALYSIS_CSV_FIELDNAMES)
             writer.writeheader()
 
-            for risk_analysis in risk_analyses:
-                writer.writerow(risk_analysis.to_dict())
+            writer.writerows(risk_analysis.to_dict() for risk_analysis in risk_analyses)
 
         print(
             f"Risk analysis CSV file {filename} generated with {len(risk_analyses)} classifications."
@@ -760,24 +781,19 @@ $(document).ready(function() {{
         self, workbook: Workbook, user_account_roles: List[UserAccountRoleGroup]
     ):
         """Add the 'Accounts' worksheet with account analysis."""
-        # Create new worksheet
-        ws_accounts = workbook.create_sheet(title="Accounts")
-
         # Extract account analyses
         account_analyses = self._extract_account_analyses(user_account_roles)
 
-        # Add headers
-        ws_accounts.append(ACCOUNT_ANALYSIS_CSV_FIELDNAMES)
-
-        # Add data rows
+        rows = []
         for account_analysis in account_analyses:
             row_data = account_analysis.to_dict()
-            ws_accounts.append(
+            rows.append(
                 [row_data.get(col, "") for col in ACCOUNT_ANALYSIS_CSV_FIELDNAMES]
             )
 
-        # Apply formatting
-        self._format_excel_worksheet(ws_accounts)
+        self._write_excel_worksheet(
+            workbook, "Accounts", ACCOUNT_ANALYSIS_CSV_FIELDNAMES, rows
+        )
 
         print(f"Added 'Accounts' worksheet with {len(account_analyses)} accounts.")
 
@@ -785,24 +801,17 @@ $(document).ready(function() {{
         self, workbook: Workbook, user_account_roles: List[UserAccountRoleGroup]
     ):
         """Add the 'Risk Analysis' worksheet."""
-        # Create new worksheet
-        ws_risk = workbook.create_sheet(title="Risk Analysis")
-
         # Extract risk analyses
         risk_analyses = self._extract_risk_analyses(user_account_roles)
 
-        # Add headers
-        ws_risk.append(RISK_ANALYSIS_CSV_FIELDNAMES)
-
-        # Add data rows
+        rows = []
         for risk_analysis in risk_analyses:
             row_data = risk_analysis.to_dict()
-            ws_risk.append(
-                [row_data.get(col, "") for col in RISK_ANALYSIS_CSV_FIELDNAMES]
-            )
+            rows.append([row_data.get(col, "") for col in RISK_ANALYSIS_CSV_FIELDNAMES])
 
-        # Apply formatting
-        self._format_excel_worksheet(ws_risk)
+        self._write_excel_worksheet(
+            workbook, "Risk Analysis", RISK_ANALYSIS_CSV_FIELDNAMES, rows
+        )
 
         print(
             f"Added 'Risk Analysis' worksheet with {len(risk_analyses)} classifications."
@@ -812,88 +821,80 @@ $(document).ready(function() {{
         self, workbook: Workbook, user_account_roles: List[UserAccountRoleGroup]
     ):
         """Add a 'Summary' worksheet with key metrics."""
-        # Create new worksheet
-        ws_summary = workbook.create_sheet(title="Summary")
-
-        # Calculate summary metrics
-        total_users = len(set(uar.user.username for uar in user_account_roles))
-        total_accounts = len(set(uar.account.id for uar in user_account_roles))
-        total_roles = len(set(uar.role.name for uar in user_account_roles))
-
-        # Count by access level
-        admin_count = len(
-            [
-                uar
-                for uar in user_account_roles
-                if uar.role.access_level == AccessLevel.FULL_ADMIN
-                and uar.user.status.lower() != "disabled"
-            ]
-        )
-        read_write_count = len(
-            [
-                uar
-                for uar in user_account_roles
-                if uar.role.access_level == AccessLevel.READ_WRITE
-                and uar.user.status.lower() != "disabled"
-            ]
-        )
-        read_only_count = len(
-            [
-                uar
-                for uar in user_account_roles
-                if uar.role.access_level == AccessLevel.READ_ONLY
-                and uar.user.status.lower() != "disabled"
-            ]
-        )
-
-        # Count by risk level
-        high_risk_count = len(
-            [
-                uar
-                for uar in user_account_roles
-                if uar.role.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]
-                and uar.user.status.lower() != "disabled"
-            ]
-        )
-
-        # Count by classification
-        classifications = {}
-        for uar in user_account_roles:
-            classification = uar.account.classification
-            if classification not in classifications:
-                classifications[classification] = set()
-            classifications[classification].add(uar.user.username)
+        metrics = self._compute_summary_metrics(user_account_roles)
 
         # Add summary data
         summary_data = [
-            ["Metric", "Value"],
-            ["Total Users", total_users],
-            ["Total Accounts", total_accounts],
-            ["Total Roles", total_roles],
+            ["Total Users", metrics["total_users"]],
+            ["Total Accounts", metrics["total_accounts"]],
+            ["Total Roles", metrics["total_roles"]],
             ["", ""],
             ["Access Level Distribution", ""],
-            ["Admin Users", admin_count],
-            ["Read Write Users", read_write_count],
-            ["Read Only Users", read_only_count],
+            ["Admin Users", metrics["admin_count"]],
+            ["Read Write Users", metrics["read_write_count"]],
+            ["Read Only Users", metrics["read_only_count"]],
             ["", ""],
             ["Risk Analysis", ""],
-            ["High/Critical Risk Users", high_risk_count],
+            ["High/Critical Risk Users", metrics["high_risk_count"]],
             ["", ""],
             ["Users by Classification", ""],
         ]
 
-        for classification, users in sorted(classifications.items()):
-            summary_data.append([f"{classification} Users", len(users)])
+        for classification, user_count in metrics["users_by_classification"]:
+            summary_data.append([f"{classification} Users", user_count])
 
-        # Add all rows
-        for row in summary_data:
-            ws_summary.append(row)
-
-        # Apply formatting
-        self._format_excel_worksheet(ws_summary)
+        self._write_excel_worksheet(
+            workbook, "Summary", ["Metric", "Value"], summary_data
+        )
 
         print("Added 'Summary' worksheet with key metrics.")
 
+    def _compute_summary_metrics(
+        self, user_account_roles: List[UserAccountRoleGroup]
+    ) -> Dict[str, Any]:
+        """Compute the key metrics shown in the HTML and Excel summaries."""
+        usernames = set()
+        account_ids = set()
+        role_names = set()
+        access_counts = {
+            AccessLevel.FULL_ADMIN: 0,
+            AccessLevel.READ_WRITE: 0,
+            AccessLevel.READ_ONLY: 0,
+        }
+        high_risk_count = 0
+        classifications = {}
+
+        for uar in user_account_roles:
+            usernames.add(uar.user.username)
+            account_ids.add(uar.account.id)
+            role_names.add(uar.role.name)
+            classifications.setdefault(uar.account.classification, set()).add(
+                uar.user.username
+            )
+
+            # Access and risk counts only include active users
+            if uar.user.status.lower() == "disabled":
+                continue
+
+            if uar.role.access_level in access_counts:
+                access_counts[uar.role.access_level] += 1
+            if uar.role.risk_level in (RiskLevel.HIGH, RiskLevel.CRITICAL):
+                high_risk_count += 1
+
+        return {
+            "total_users": len(usernames),
+            "total_accounts": len(account_ids),
+            "total_roles": len(role_names),
+            "admin_count": access_counts[AccessLevel.FULL_ADMIN],
+            "read_write_count": access_counts[AccessLevel.READ_WRITE],
+            "read_only_count": access_counts[AccessLevel.READ_ONLY],
+            "high_risk_count": high_risk_count,
+            "users_by_classification": [
+                (classification, len(users))
+                for classification, users in sorted(classifications.items())
+            ],
+        }
+
     def _extract_account_analyses(
         self, user_account_roles: List[UserAccountRoleGroup]
     ) -> List[AccountAnalysis]:
@@ -9,7 +9,12 @@ import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 
 def print_progress(current: int, total: int, message: str = "Processing"):
@@ -84,6 +89,17 @@ def load_from_json(filename: str) -> List[Dict[str, Any]]:
         return []
 
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Parse errors raise json.JSONDecodeError in both cases.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def format_timestamp(timestamp: Optional[datetime]) -> str:
     """Format timestamp to ISO string."""
     if timestamp is None:
@@ -0,0 +1,131 @@
+"""
+Tests for Account Classifier module.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.account_classifier import AccountClassifier
+from src.data_models import AWSAccount
+
+CASES = [
+    ("acme-prod-eu", "Production"),
+    ("acme-nonprod", "Development"),
+    ("acme-devops", "Unclassified"),
+    ("ACME-DEV-1", "Development"),
+    ("sandbox", "Unclassified"),
+]
+
+
+class FakeAutomaton:
+    """Pure-Python stand-in for ahocorasick.Automaton's matching interface."""
+
+    def __init__(self):
+        self._words = {}
+        self.built = False
+
+    def __len__(self):
+        return len(self._words)
+
+    def get(self, word, default=None):
+        return self._words.get(word, default)
+
+    def add_word(self, word, payload):
+        self._words[word] = payload
+
+    def make_automaton(self):
+        self.built = True
+
+    def iter(self, text):
+        assert self.built, "make_automaton() must be called before iter()"
+        for word, payload in self._words.items():
+            start = text.find(word)
+            while start != -1:
+                yield start + len(word) - 1, payload
+                start = text.find(word, start + 1)
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Write a small classification config."""
+    path = tmp_path / "account_classification.yaml"
+    path.write_text(
+        "classifications:\n"
+        "  Production:\n"
+        "    include: ['-prod-', 'prod']\n"
+        "    exclude: ['nonprod']\n"
+        "  Development:\n"
+        "    include: ['dev', 'nonprod']\n"
+        "    exclude: ['devops']\n"
+        "default_classification: Unclassified\n",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+class TestAccountClassifier:
+    """Test AccountClassifier pattern matching."""
+
+    @pytest.mark.parametrize("name,expected", CASES)
+    def test_classify_account(self, config_path, name, expected):
+        """Test first matching classification wins and excludes apply."""
+        classifier = AccountClassifier(config_path)
+
+        assert classifier.classify_account(AWSAccount(id="1", name=name)) == expected
+
+    @pytest.mark.parametrize("name,expected", CASES)
+    def test_classify_account_without_ahocorasick(self, config_path, name, expected):
+        """Test the regex fallback classifies the same way."""
+        with patch("src.account_classifier.ahocorasick", None):
+            classifier = AccountClassifier(config_path)
+
+        assert classifier.classify_account(AWSAccount(id="1", name=name)) == expected
+
+    @pytest.mark.parametrize("name,expected", CASES)
+    def test_classify_account_with_automaton(self, config_path, name, expected):
+        """Test the automaton path classifies the same way, with or without pyahocorasick."""
+        fake = SimpleNamespace(Automaton=FakeAutomaton)
+        with patch("src.account_classifier.ahocorasick", fake):
+            classifier = AccountClassifier(config_path)
+
+        assert classifier._use_automaton
+        assert classifier.classify_account(AWSAccount(id="1", name=name)) == expected
+
+    @pytest.mark.parametrize("name,expected", CASES)
+    def test_classify_account_with_pyahocorasick(self, config_path, name, expected):
+        """Test the real pyahocorasick automaton when it is installed."""
+        real = pytest.importorskip("ahocorasick")
+        with patch("src.account_classifier.ahocorasick", real):
+            classifier = AccountClassifier(config_path)
+
+        assert classifier._use_automaton
+        assert classifier.classify_account(AWSAccount(id="1", name=name)) == expected
+
+    def test_automaton_payload_records_each_rule(self, config_path):
+        """Test a pattern shared by several rules keeps every (classification, polarity)."""
+        fake = SimpleNamespace(Automaton=FakeAutomaton)
+        with patch("src.account_classifier.ahocorasick", fake):
+            classifier = AccountClassifier(config_path)
+
+        assert classifier._automaton.get("nonprod") == [
+            ("Production", "exclude"),
+            ("Development", "include"),
+        ]
+
+    def test_missing_config(self, tmp_path):
+        """Test a missing config classifies everything as the default."""
+        classifier = AccountClassifier(str(tmp_path / "missing.yaml"))
+
+        account = AWSAccount(id="1", name="acme-prod")
+        assert classifier.classify_account(account) == "Unclassified"
+
+    def test_config_parsed_once(self, config_path):
+        """Test the YAML is parsed once per file version."""
+        with patch("src.account_classifier.yaml.load", wraps=yaml.load) as load:
+            AccountClassifier(config_path)
+            AccountClassifier(config_path)
+
+        assert load.call_count == 1
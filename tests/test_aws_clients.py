@@ -6,7 +6,7 @@ These tests use mocks to avoid real AWS connections.
 
 from unittest.mock import Mock, patch
 
-from src.aws_clients import AWSClients, aws_clients
+from src.aws_clients import CLIENT_CONFIG, AWSClients, aws_clients
 
 
 class TestAWSClients:
@@ -38,7 +38,9 @@ class TestAWSClients:
         # First access should create the client
         result = clients.sso_admin
         assert result == mock_sso_client
-        mock_session_instance.client.assert_called_once_with("sso-admin")
+        mock_session_instance.client.assert_called_once_with(
+            "sso-admin", config=CLIENT_CONFIG
+        )
 
         # Second access should return cached client
         result2 = clients.sso_admin
@@ -58,7 +60,9 @@ class TestAWSClients:
 
         result = clients.identitystore
         assert result == mock_identity_client
-        mock_session_instance.client.assert_called_once_with("identitystore")
+        mock_session_instance.client.assert_called_once_with(
+            "identitystore", config=CLIENT_CONFIG
+        )
 
     @patch("src.aws_clients.boto3.Session")
     def test_organizations_client_lazy_loading(self, mock_session):
@@ -72,7 +76,9 @@ class TestAWSClients:
 
         result = clients.organizations
         assert result == mock_orgs_client
-        mock_session_instance.client.assert_called_once_with("organizations")
+        mock_session_instance.client.assert_called_once_with(
+            "organizations", config=CLIENT_CONFIG
+        )
 
     @patch("src.aws_clients.boto3.Session")
     def test_cloudtrail_client_lazy_loading(self, mock_session):
@@ -86,7 +92,9 @@ class TestAWSClients:
 
         result = clients.cloudtrail
         assert result == mock_cloudtrail_client
-        mock_session_instance.client.assert_called_once_with("cloudtrail")
+        mock_session_instance.client.assert_called_once_with(
+            "cloudtrail", config=CLIENT_CONFIG
+        )
 
     @patch("src.aws_clients.boto3.Session")
     def test_instance_arn_property(self, mock_session):
@@ -150,3 +158,15 @@ class TestAWSClients:
 
         # This should work through the proxy
         assert hasattr(aws_clients, "session")
+
+    def test_proxy_follows_current_instance(self):
+        """Test the aws_clients proxy never pins attributes of an old instance."""
+        from src.aws_clients import _AWSClientsProxy
+
+        proxy = _AWSClientsProxy()
+        first, second = Mock(), Mock()
+
+        with patch("src.aws_clients.get_aws_clients", return_value=first):
+            assert proxy.sso_admin is first.sso_admin
+        with patch("src.aws_clients.get_aws_clients", return_value=second):
+            assert proxy.sso_admin is second.sso_admin
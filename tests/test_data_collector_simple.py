@@ -4,9 +4,15 @@ Simplified tests for Data Collector module.
 These tests verify basic functionality without AWS connections.
 """
 
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
-from src.data_collector import DataCollector
+from src.data_collector import AssignmentInfo, DataCollector
+from src.data_models import AccessLevel, AWSAccount, PermissionScores, Role, User
+from src.disk_cache import DiskCache
+from src.permission_analyzer_v2 import PermissionAnalyzerV2
 
 
 class TestDataCollectorSimple:
@@ -70,6 +76,415 @@ class TestDataCollectorSimple:
         # Should only call AWS API once due to caching
         mock_aws_clients.identitystore.get_paginator.assert_called_once()
 
+    @patch("src.data_collector.aws_clients")
+    def test_user_assignments_from_indexes(self, mock_aws_clients):
+        """Test direct and group assignments are resolved via principal indexes."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+        mock_aws_clients.identity_store_id = "d-test123"
+
+        collector = DataCollector()
+        collector._groups_cache = [
+            {"GroupId": "g1", "DisplayName": "Admins"},
+            {"GroupId": "g2", "DisplayName": "Readers"},
+        ]
+        assignments = {
+            ("111", "ps-admin"): [
+                ("GROUP", "g1"),
+                ("USER", "user1"),
+            ],
+            ("222", "ps-read"): [("GROUP", "g2")],
+            ("333", "ps-ops"): [("USER", "user1"), ("GROUP", "g1")],
+        }
+        group_memberships = {"g1": {"user1"}, "g2": {"user2"}}
+
+        collector._build_indexes(assignments, group_memberships)
+        result = collector._get_user_assignments_with_groups(
+            User(id="user1", username="test.user")
+        )
+
+        # Rows follow assignment-key order, not direct-then-group
+        assert result == [
+            AssignmentInfo("111", "ps-admin", "Admins", "GROUP"),
+            AssignmentInfo("111", "ps-admin", "DIRECT", "USER"),
+            AssignmentInfo("333", "ps-ops", "DIRECT", "USER"),
+            AssignmentInfo("333", "ps-ops", "Admins", "GROUP"),
+        ]
+        assert (
+            collector._get_user_assignments_with_groups(
+                User(id="user3", username="nobody")
+            )
+            == []
+        )
+        assert collector._get_user_groups("user1") == ["Admins"]
+        assert collector._get_user_groups("user3") == []
+
+    @patch("src.data_collector.aws_clients")
+    def test_get_assignments_only_queries_provisioned_pairs(self, mock_aws_clients):
+        """Test assignments are only listed where a permission set is provisioned."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+        mock_aws_clients.identity_store_id = "d-test123"
+
+        provisioned_paginator = Mock()
+        provisioned_paginator.paginate.side_effect = lambda **kwargs: [
+            {"AccountIds": ["111"] if kwargs["PermissionSetArn"] == "ps-a" else []}
+        ]
+        mock_aws_clients.sso_admin.get_paginator.return_value = provisioned_paginator
+        mock_aws_clients.sso_admin.list_account_assignments.return_value = {
+            "AccountAssignments": [
+                {"PrincipalType": "USER", "PrincipalId": "user1"},
+                {"PrincipalType": "GROUP", "PrincipalId": "g1"},
+            ]
+        }
+
+        collector = DataCollector()
+        collector._accounts_cache = {
+            "111": AWSAccount(id="111", name="Prod"),
+            "222": AWSAccount(id="222", name="Dev"),
+        }
+        collector._permission_sets_cache = {
+            "ps-a": Role(name="Admin", arn="ps-a"),
+            "ps-b": Role(name="Read", arn="ps-b"),
+        }
+        # More principals than provisioned pairs keeps the per-pair listing
+        collector._users_cache = [{"UserId": "user1"}, {"UserId": "user2"}]
+        collector._groups_cache = []
+
+        assignments = collector.get_assignments()
+
+        assert list(assignments.keys()) == [("111", "ps-a")]
+        assert assignments[("111", "ps-a")] == [("GROUP", "g1"), ("USER", "user1")]
+        assert mock_aws_clients.sso_admin.list_account_assignments.call_count == 1
+
+    @patch("src.data_collector.aws_clients")
+    def test_get_assignments_by_principal(self, mock_aws_clients):
+        """Test few principals are listed directly, each assignment once."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+        mock_aws_clients.identity_store_id = "d-test123"
+
+        def get_paginator(name):
+            paginator = Mock()
+            if name == "list_accounts_for_provisioned_permission_set":
+                paginator.paginate.return_value = [{"AccountIds": ["111", "222"]}]
+            else:
+                paginator.paginate.return_value = [
+                    {
+                        "AccountAssignments": [
+                            {
+                                "AccountId": "222",
+                                "PermissionSetArn": "ps-a",
+                                "PrincipalType": "USER",
+                                "PrincipalId": "user1",
+                            },
+                            {
+                                "AccountId": "999",
+                                "PermissionSetArn": "ps-a",
+                                "PrincipalType": "USER",
+                                "PrincipalId": "user1",
+                            },
+                            {
+                                "AccountId": "222",
+                                "PermissionSetArn": "ps-a",
+                                "PrincipalType": "USER",
+                                "PrincipalId": "user1",
+                            },
+                        ]
+                    }
+                ]
+            return paginator
+
+        mock_aws_clients.sso_admin.get_paginator.side_effect = get_paginator
+
+        collector = DataCollector()
+        collector._accounts_cache = {
+            "111": AWSAccount(id="111", name="Prod"),
+            "222": AWSAccount(id="222", name="Dev"),
+        }
+        collector._permission_sets_cache = {"ps-a": Role(name="Admin", arn="ps-a")}
+        collector._users_cache = [{"UserId": "user1"}]
+        collector._groups_cache = []
+
+        assignments = collector.get_assignments()
+
+        assert list(assignments.keys()) == [("222", "ps-a")]
+        assert assignments[("222", "ps-a")] == [("USER", "user1")]
+        mock_aws_clients.sso_admin.list_account_assignments.assert_not_called()
+
+    @patch("src.data_collector.aws_clients")
+    def test_assignments_by_principal_are_sorted_per_pair(self, mock_aws_clients):
+        """Test principals within a pair come out in a path-independent order."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+
+        def assignment(principal_type, principal_id):
+            return {
+                "AccountId": "111",
+                "PermissionSetArn": "ps-a",
+                "PrincipalType": principal_type,
+                "PrincipalId": principal_id,
+            }
+
+        listings = {
+            ("USER", "user1"): [assignment("USER", "user1")],
+            ("GROUP", "g2"): [assignment("GROUP", "g2")],
+            ("GROUP", "g1"): [assignment("GROUP", "g1")],
+        }
+
+        collector = DataCollector()
+        with patch.object(
+            collector,
+            "_fetch_principal_assignments",
+            side_effect=lambda *principal: listings[principal],
+        ), ThreadPoolExecutor() as executor:
+            assignments = collector._get_assignments_by_principal(
+                executor, list(listings), [("111", "ps-a")]
+            )
+
+        assert assignments == {
+            ("111", "ps-a"): [("GROUP", "g1"), ("GROUP", "g2"), ("USER", "user1")]
+        }
+
+    @patch("src.data_collector.aws_clients")
+    def test_fetch_account_assignments_follows_next_token(self, mock_aws_clients):
+        """Test assignment listing follows NextToken across pages."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+        mock_aws_clients.identity_store_id = "d-test123"
+
+        mock_aws_clients.sso_admin.list_account_assignments.side_effect = [
+            {
+                "AccountAssignments": [{"PrincipalType": "USER", "PrincipalId": "u1"}],
+                "NextToken": "t1",
+            },
+            {"AccountAssignments": [{"PrincipalType": "GROUP", "PrincipalId": "g2"}]},
+        ]
+
+        collector = DataCollector()
+        result = collector._fetch_account_assignments("111", "ps-a")
+
+        assert result == [("USER", "u1"), ("GROUP", "g2")]
+        calls = mock_aws_clients.sso_admin.list_account_assignments.call_args_list
+        assert "NextToken" not in calls[0].kwargs
+        assert calls[1].kwargs["NextToken"] == "t1"
+
+    @patch("src.data_collector.aws_clients")
+    def test_disk_cache_round_trip(self, mock_aws_clients):
+        """Test assignments and memberships are served from the disk cache."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+        mock_aws_clients.identity_store_id = "d-test123"
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir)
+            cache.save("assignment_principals", [["111", "ps-a", [["USER", "u1"]]]])
+            cache.save("group_memberships", {"g1": ["u1", "u2"]})
+
+            collector = DataCollector(cache=cache)
+
+            assert collector.get_assignments() == {("111", "ps-a"): [("USER", "u1")]}
+            assert collector.get_group_memberships() == {"g1": {"u1", "u2"}}
+            mock_aws_clients.sso_admin.get_paginator.assert_not_called()
+            mock_aws_clients.identitystore.get_paginator.assert_not_called()
+
+    @patch("src.data_collector.aws_clients")
+    def test_permission_set_names_reused_from_cache(self, mock_aws_clients):
+        """Test only permission sets missing from the name cache are described."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+        mock_aws_clients.identity_store_id = "d-test123"
+
+        paginator = Mock()
+        paginator.paginate.return_value = [{"PermissionSets": ["ps-a", "ps-b"]}]
+        mock_aws_clients.sso_admin.get_paginator.return_value = paginator
+        mock_aws_clients.sso_admin.describe_permission_set.return_value = {
+            "PermissionSet": {"Name": "ReadOnly"}
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir)
+            cache.save("permission_set_names", {"ps-a": ["Admin", time.time()]})
+
+            collector = DataCollector(cache=cache)
+
+            assert collector._fetch_permission_set_names() == {
+                "ps-a": "Admin",
+                "ps-b": "ReadOnly",
+            }
+            mock_aws_clients.sso_admin.describe_permission_set.assert_called_once_with(
+                InstanceArn="arn:aws:sso:::instance/ssoins-test",
+                PermissionSetArn="ps-b",
+            )
+            assert set(cache.load("permission_set_names")) == {"ps-a", "ps-b"}
+
+    @patch("src.data_collector.aws_clients")
+    def test_permission_set_analysis_reused_from_cache(self, mock_aws_clients):
+        """Test only permission sets missing from the analysis cache are analyzed."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+        mock_aws_clients.identity_store_id = "d-test123"
+
+        mock_analyzer = Mock()
+        mock_analyzer.create_role_from_permission_set.side_effect = (
+            lambda arn, name: Role(
+                name=name,
+                arn=arn,
+                access_level=AccessLevel.READ_ONLY,
+                scores=PermissionScores(read_score=5, justification="Read"),
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir)
+            cache.save("permission_sets", {"ps-a": "Admin", "ps-b": "ReadOnly"})
+            cache.save(
+                "permission_set_analysis",
+                {"ps-a": ["Admin", 0, 5, 10, "Full admin", time.time()]},
+            )
+
+            with patch("src.data_collector.permission_analyzer_v2", new=mock_analyzer):
+                permission_sets = DataCollector(cache=cache).get_permission_sets()
+
+            mock_analyzer.create_role_from_permission_set.assert_called_once_with(
+                "ps-b", "ReadOnly"
+            )
+            assert list(permission_sets) == ["ps-a", "ps-b"]
+            assert permission_sets["ps-a"].access_level is AccessLevel.FULL_ADMIN
+            assert permission_sets["ps-a"].scores == PermissionScores(
+                0, 5, 10, "Full admin"
+            )
+            assert cache.load("permission_set_analysis")["ps-b"][:5] == [
+                "Read Only",
+                5,
+                0,
+                0,
+                "Read",
+            ]
+
+    @patch("src.data_collector.aws_clients")
+    def test_failed_policy_listing_not_cached(self, mock_aws_clients):
+        """Test a failed managed-policy listing is never saved as an analysis."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+        mock_aws_clients.identity_store_id = "d-test123"
+
+        def paginate(PermissionSetArn, **kwargs):
+            if PermissionSetArn == "ps-a":
+                raise RuntimeError("ThrottlingException")
+            return [{"AttachedManagedPolicies": [{"Name": "ReadOnlyAccess"}]}]
+
+        analyzer_clients = Mock()
+        analyzer_clients.sso_admin.get_paginator.return_value.paginate = paginate
+        analyzer_clients.sso_admin.get_inline_policy_for_permission_set.return_value = {
+            "InlinePolicy": '{"Statement": [{"Effect": "Allow", "Action": "s3:Get*"}]}'
+        }
+        with patch("src.permission_analyzer_v2.aws_clients", new=analyzer_clients):
+            analyzer = PermissionAnalyzerV2()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir)
+            cache.save("permission_sets", {"ps-a": "Admin", "ps-b": "ReadOnly"})
+
+            with patch("src.data_collector.permission_analyzer_v2", new=analyzer):
+                permission_sets = DataCollector(cache=cache).get_permission_sets()
+
+            assert permission_sets["ps-a"].access_level is AccessLevel.UNKNOWN
+            assert set(cache.load("permission_set_analysis")) == {"ps-b"}
+
+    @patch("src.data_collector.aws_clients")
+    def test_collect_all_data_end_to_end(self, mock_aws_clients):
+        """Test the concurrent collection pipeline produces user assignments."""
+        mock_aws_clients.sso_admin = Mock()
+        mock_aws_clients.identitystore = Mock()
+        mock_aws_clients.organizations = Mock()
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+        mock_aws_clients.identity_store_id = "d-test123"
+
+        pages = {
+            "list_users": [
+                {
+                    "Users": [
+                        {"UserId": "user1", "UserName": "john.doe"},
+                        {"UserId": "user2", "UserName": "jane.doe"},
+                    ]
+                }
+            ],
+            "list_groups": [{"Groups": [{"GroupId": "g1", "DisplayName": "Admins"}]}],
+            "list_group_memberships": [
+                {"GroupMemberships": [{"MemberId": {"UserId": "user1"}}]}
+            ],
+            "list_accounts": [{"Accounts": [{"Id": "111", "Name": "Prod"}]}],
+            "list_permission_sets": [{"PermissionSets": ["ps-a"]}],
+            "list_accounts_for_provisioned_permission_set": [{"AccountIds": ["111"]}],
+        }
+
+        def get_paginator(name):
+            paginator = Mock()
+            paginator.paginate.return_value = pages[name]
+            return paginator
+
+        for client in ("sso_admin", "identitystore", "organizations"):
+            getattr(mock_aws_clients, client).get_paginator.side_effect = get_paginator
+        mock_aws_clients.sso_admin.describe_permission_set.return_value = {
+            "PermissionSet": {"Name": "Admin"}
+        }
+        mock_aws_clients.sso_admin.list_account_assignments.return_value = {
+            "AccountAssignments": [{"PrincipalType": "GROUP", "PrincipalId": "g1"}]
+        }
+        # Pass the mock explicitly so patching does not touch the lazy proxy
+        mock_analyzer = Mock()
+        mock_analyzer.create_role_from_permission_set.side_effect = (
+            lambda arn, name: Role(name=name, arn=arn)
+        )
+
+        with patch("src.data_collector.permission_analyzer_v2", new=mock_analyzer):
+            collector = DataCollector()
+            user_account_roles, user_summaries = collector.collect_all_data()
+            streamed = list(collector.iter_user_account_roles())
+
+        assert [
+            (uar.user.username, uar.account.name) for uar in user_account_roles
+        ] == [
+            ("john.doe", "Prod"),
+            ("jane.doe", ""),
+        ]
+        assert user_account_roles[0].responsible_group == "Admins"
+        assert user_account_roles[0].user.groups == ["Admins"]
+        assert len(user_summaries) == 2
+        assert [uar.to_dict() for uar in streamed] == [
+            uar.to_dict() for uar in user_account_roles
+        ]
+
+    def test_global_proxy_follows_current_instance(self):
+        """Test the data_collector proxy never pins attributes of an old instance."""
+        from src.data_collector import _DataCollectorProxy
+
+        proxy = _DataCollectorProxy()
+        first, second = Mock(), Mock()
+
+        with patch("src.data_collector.get_data_collector", return_value=first):
+            assert proxy.collect_all_data is first.collect_all_data
+        with patch("src.data_collector.get_data_collector", return_value=second):
+            assert proxy.collect_all_data is second.collect_all_data
+
     @patch("src.data_collector.get_data_collector")
     def test_global_instance_proxy_exists(self, mock_get_data_collector):
         """Test that global data_collector proxy exists."""
@@ -163,6 +163,22 @@ class TestUserAccountRoleGroup:
         assert result["Write Score"] == 7
         assert result["Admin Score"] == 9
 
+    def test_user_account_role_group_as_csv_tuple(self):
+        """Test as_csv_tuple follows CSV_FIELDNAMES order."""
+        from src.data_models import CSV_FIELDNAMES
+
+        user = User(id="user123", username="john.doe", status="Disabled")
+        account = AWSAccount(id="123456789012", name="Prod")
+        role = Role(name="Admin", arn="arn:aws:sso:::ps-123")
+
+        assignment = UserAccountRoleGroup(user=user, account=account, role=role)
+        row = assignment.as_csv_tuple()
+
+        assert len(row) == len(CSV_FIELDNAMES)
+        assert dict(zip(CSV_FIELDNAMES, row)) == assignment.to_dict()
+        assert row[CSV_FIELDNAMES.index("Access Level")] == "No access"
+        assert row[CSV_FIELDNAMES.index("Responsible Group")] == "DIRECT"
+
     def test_user_account_role_group_default_values(self):
         """Test UserAccountRoleGroup with default values."""
         user = User(id="user123", username="john.doe", email="john@example.com")
@@ -0,0 +1,111 @@
+"""
+Tests for Disk Cache module.
+"""
+
+import os
+import tempfile
+import time
+
+import pytest
+
+from src.disk_cache import DiskCache, default_cache_dir
+
+
+class TestDiskCache:
+    """Test DiskCache snapshot storage."""
+
+    def test_save_and_load(self):
+        """Test a saved snapshot is loaded back while fresh."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(os.path.join(temp_dir, "cache"))
+            cache.save("users", [{"UserId": "user1"}])
+
+            assert cache.load("users") == [{"UserId": "user1"}]
+            assert os.listdir(os.path.join(temp_dir, "cache")) == ["users.json"]
+
+    def test_missing_entry(self):
+        """Test a missing snapshot loads as None."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert DiskCache(temp_dir).load("users") is None
+
+    def test_expired_entry(self):
+        """Test snapshots older than the TTL are ignored."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir, ttl=60)
+            cache.save("users", [])
+
+            old = time.time() - 120
+            os.utime(os.path.join(temp_dir, "users.json"), (old, old))
+
+            assert cache.load("users") is None
+
+    def test_ttl_override(self):
+        """Test a per-load TTL keeps longer-lived snapshots."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir, ttl=60)
+            cache.save("names", {})
+
+            old = time.time() - 120
+            os.utime(os.path.join(temp_dir, "names.json"), (old, old))
+
+            assert cache.load("names", ttl=3600) == {}
+
+    def test_refresh_ignores_existing(self):
+        """Test a refreshing cache ignores snapshots but still writes them."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            DiskCache(temp_dir).save("users", [1])
+            cache = DiskCache(temp_dir, refresh=True)
+
+            assert cache.load("users") is None
+            cache.save("users", [2])
+            assert DiskCache(temp_dir).load("users") == [2]
+
+    def test_corrupt_entry(self):
+        """Test unreadable snapshots load as None."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "users.json"), "w") as f:
+                f.write("{not json")
+
+            assert DiskCache(temp_dir).load("users") is None
+
+    def test_default_cache_dir(self, monkeypatch):
+        """Test the default cache directory is per user and keyed by Identity Store."""
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        path = default_cache_dir("d-123")
+
+        assert path == os.path.join(
+            os.path.expanduser("~"), ".cache", "aws-sso-report", "d-123"
+        )
+        assert not path.startswith(tempfile.gettempdir())
+
+    def test_default_cache_dir_honors_xdg(self, monkeypatch):
+        """Test XDG_CACHE_HOME overrides the default cache root."""
+        monkeypatch.setenv("XDG_CACHE_HOME", "/xdg")
+
+        assert default_cache_dir("d-123") == os.path.join(
+            "/xdg", "aws-sso-report", "d-123"
+        )
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_writable_by_others_is_refused(self):
+        """Test a group or world writable cache directory is neither read nor written."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir)
+            cache.save("users", [{"UserId": "user1"}])
+            os.chmod(temp_dir, 0o777)
+
+            assert cache.load("users") is None
+            with pytest.raises(PermissionError):
+                cache.save("users", [])
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_foreign_owner_is_refused(self, monkeypatch):
+        """Test a cache directory owned by another user is neither read nor written."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(temp_dir)
+            cache.save("users", [{"UserId": "user1"}])
+            monkeypatch.setattr(os, "getuid", lambda: os.stat(temp_dir).st_uid + 1)
+
+            assert cache.load("users") is None
+            with pytest.raises(PermissionError):
+                cache.save("users", [])
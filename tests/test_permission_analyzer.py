@@ -6,7 +6,7 @@ These tests use mocks to avoid real AWS connections.
 
 from unittest.mock import Mock, patch
 
-from src.data_models import AWSAccount, Role, User
+from src.data_models import AccessLevel, AWSAccount, Role, User
 from src.permission_analyzer import PermissionAnalyzer, permission_analyzer
 
 
@@ -29,6 +29,32 @@ class TestPermissionAnalyzer:
         assert analyzer.cloudtrail == mock_cloudtrail
         assert analyzer.instance_arn == "arn:aws:sso:::instance/ssoins-123"
 
+    @patch("src.permission_analyzer.aws_clients")
+    def test_admin_policy_stops_managed_policy_paging(self, mock_aws_clients):
+        """Test pages after an admin managed policy are never requested."""
+        mock_sso_admin = Mock()
+        mock_aws_clients.sso_admin = mock_sso_admin
+        mock_aws_clients.instance_arn = "arn:aws:sso:::instance/ssoins-123"
+        mock_sso_admin.get_inline_policy_for_permission_set.return_value = {
+            "InlinePolicy": ""
+        }
+
+        requested = []
+
+        def pages(**kwargs):
+            for name in ("AdministratorAccess", "ReadOnlyAccess"):
+                requested.append(name)
+                yield {"AttachedManagedPolicies": [{"Name": name}]}
+
+        mock_sso_admin.get_paginator.return_value.paginate.side_effect = pages
+
+        analyzer = PermissionAnalyzer()
+        access_level, scores = analyzer.analyze_permission_set("ps-123")
+
+        assert access_level == AccessLevel.FULL_ADMIN
+        assert scores.admin_score == 10
+        assert requested == ["AdministratorAccess"]
+
     @patch("src.permission_analyzer.aws_clients")
     def test_get_permission_set_policies(self, mock_aws_clients):
         """Test get_permission_set_policies method with mocked responses."""
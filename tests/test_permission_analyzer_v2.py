@@ -0,0 +1,94 @@
+"""
+Tests for Permission Analyzer V2 module.
+
+These tests use mocks to avoid real AWS connections.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+from src.data_models import AccessLevel
+from src.permission_analyzer_v2 import PermissionAnalyzerV2
+
+
+def _make_analyzer(managed_policies, inline_policy=None):
+    """Create an analyzer whose SSO Admin client returns the given policies."""
+    mock_clients = Mock()
+    mock_clients.instance_arn = "arn:aws:sso:::instance/ssoins-test"
+
+    paginator = Mock()
+    paginator.paginate.return_value = [{"AttachedManagedPolicies": managed_policies}]
+    mock_clients.sso_admin.get_paginator.return_value = paginator
+    mock_clients.sso_admin.get_inline_policy_for_permission_set.return_value = {
+        "InlinePolicy": inline_policy
+    }
+
+    # Pass the mock explicitly so patching does not touch the lazy proxy
+    with patch("src.permission_analyzer_v2.aws_clients", new=mock_clients):
+        return PermissionAnalyzerV2()
+
+
+class TestPermissionAnalyzerV2:
+    """Test PermissionAnalyzerV2 with mocked AWS clients."""
+
+    def test_identical_policies_analyzed_once(self):
+        """Test permission sets with the same policies share one analysis."""
+        analyzer = _make_analyzer(
+            [{"Name": "ReadOnlyAccess", "Arn": "arn:aws:iam::aws:policy/ReadOnly"}]
+        )
+
+        with patch.object(
+            analyzer, "_analyze_policies_v2", wraps=analyzer._analyze_policies_v2
+        ) as analyze:
+            level_a, scores_a = analyzer.analyze_permission_set("ps-a")
+            level_b, scores_b = analyzer.analyze_permission_set("ps-b")
+
+        assert analyze.call_count == 1
+        assert level_a == level_b == AccessLevel.READ_ONLY
+        assert scores_a == scores_b
+        assert scores_a is not scores_b
+
+    def test_policy_cache_is_bounded(self):
+        """Test results keyed by policy content are evicted past the cache size."""
+        with patch("src.permission_analyzer_v2.ANALYSIS_CACHE_SIZE", 2):
+            analyzer = _make_analyzer([])
+        for action in ["s3:GetObject", "ec2:DescribeInstances", "iam:ListRoles"]:
+            analyzer._get_inline_policy = Mock(
+                return_value=json.dumps(
+                    {"Statement": [{"Effect": "Allow", "Action": action}]}
+                )
+            )
+            analyzer.analyze_permission_set(action)
+
+        info = analyzer._score_policies.cache_info()
+        assert info.maxsize == 2
+        assert info.currsize == 2
+
+    def test_analyze_many(self):
+        """Test bulk analysis fetches each distinct permission set once."""
+        analyzer = _make_analyzer(
+            [{"Name": "ReadOnlyAccess", "Arn": "arn:aws:iam::aws:policy/ReadOnly"}]
+        )
+        analyzer.analyze_permission_set("ps-a")
+
+        results = analyzer.analyze_many(["ps-a", "ps-b", "ps-c", "ps-b"])
+
+        assert list(results) == ["ps-a", "ps-b", "ps-c"]
+        assert results["ps-b"][0] == AccessLevel.READ_ONLY
+        inline = analyzer.sso_admin.get_inline_policy_for_permission_set
+        assert inline.call_count == 3
+        assert analyzer.cache_info().hits == 1
+        assert analyzer.cache_info().misses == 3
+
+    def test_detailed_analysis_reuses_fetched_policies(self):
+        """Test the detailed view does not refetch an analyzed permission set."""
+        analyzer = _make_analyzer(
+            [{"Name": "ReadOnlyAccess", "Arn": "arn:aws:iam::aws:policy/ReadOnly"}]
+        )
+        analyzer.analyze_permission_set("ps-a")
+
+        analysis = analyzer.get_detailed_analysis("ps-a")
+
+        assert analysis["managed_policies"][0]["name"] == "ReadOnlyAccess"
+        inline = analyzer.sso_admin.get_inline_policy_for_permission_set
+        assert inline.call_count == 1
@@ -7,10 +7,13 @@ These tests verify report generation works correctly without AWS connections.
 import json
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
+from openpyxl import load_workbook
 
 from src.data_models import (
+    AccessLevel,
     AWSAccount,
     PermissionScores,
     Role,
@@ -112,6 +115,12 @@ class TestReportGenerator:
                 assert os.path.exists(excel_file)
                 assert os.path.getsize(excel_file) > 0  # File should have content
 
+                # Data cells wrap their text
+                sheet = load_workbook(excel_file)["Data"]
+                assert sheet["A2"].value == "John Doe"
+                assert sheet["A2"].alignment.wrap_text
+                assert not sheet["A1"].alignment.wrap_text
+
             finally:
                 os.chdir(original_cwd)
 
@@ -264,3 +273,118 @@ class TestReportGenerator:
 
             finally:
                 os.chdir(original_cwd)
+
+    def test_render_html_table_escapes_text(self):
+        """Test HTML table cells are escaped and line breaks converted."""
+        generator = ReportGenerator()
+
+        html = generator._render_html_table(
+            [{"Name": "<b>a & b</b>\nc", "Emails": "x@a; y@a", "Count": 3}],
+            ["Name", "Emails", "Count"],
+            line_break_columns=["Emails"],
+        )
+
+        assert "<td>&lt;b&gt;a &amp; b&lt;/b&gt;<br>c</td>" in html
+        assert "<td>x@a<br>y@a</td>" in html
+        assert "<td>3</td>" in html
+
+    def test_compute_summary_metrics(self):
+        """Test summary metrics count active users by access level."""
+        account = AWSAccount(id="123456789012", name="Production")
+        account.classification = "Production"
+        admin = Role(
+            name="AdminRole",
+            arn="arn:aws:sso:::permissionSet/ps-123",
+            access_level=AccessLevel.FULL_ADMIN,
+        )
+        reader = Role(
+            name="ReadRole",
+            arn="arn:aws:sso:::permissionSet/ps-456",
+            access_level=AccessLevel.READ_ONLY,
+        )
+        active = User(id="user1", username="john.doe", status="Enabled")
+        disabled = User(id="user2", username="jane.doe", status="Disabled")
+
+        metrics = ReportGenerator()._compute_summary_metrics(
+            [
+                UserAccountRoleGroup(user=active, account=account, role=admin),
+                UserAccountRoleGroup(user=active, account=account, role=reader),
+                UserAccountRoleGroup(user=disabled, account=account, role=admin),
+            ]
+        )
+
+        assert metrics["total_users"] == 2
+        assert metrics["total_accounts"] == 1
+        assert metrics["total_roles"] == 2
+        assert metrics["admin_count"] == 1
+        assert metrics["read_write_count"] == 0
+        assert metrics["read_only_count"] == 1
+        assert metrics["users_by_classification"] == [("Production", 2)]
+
+    def test_generate_all_reports(self):
+        """Test all report files are written when generated together."""
+        user = User(id="user1", username="john.doe", email="john@example.com")
+        account = AWSAccount(id="123456789012", name="Production")
+        role = Role(name="AdminRole", arn="arn:aws:sso:::permissionSet/ps-123")
+        user_account_roles = [
+            UserAccountRoleGroup(user=user, account=account, role=role)
+        ]
+        user_summaries = [UserSummary(user=user, accounts=[])]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(temp_dir)
+                generator = ReportGenerator(output_prefix="test_all")
+                generator.generate_all_reports(user_account_roles, user_summaries)
+
+                assert sorted(os.listdir(temp_dir)) == [
+                    "test_all.csv",
+                    "test_all.html",
+                    "test_all.json",
+                    "test_all.xlsx",
+                    "test_all_accounts.csv",
+                    "test_all_analysis.csv",
+                    "test_all_risk_analysis.csv",
+                ]
+
+            finally:
+                os.chdir(original_cwd)
+
+    def test_json_report_same_without_orjson(self):
+        """Test the JSON report is identical with and without orjson."""
+        user = User(id="user1", username="jöhn.doe", email="john@example.com")
+        user_summaries = [
+            UserSummary(
+                user=user, accounts=[{"id": "123456789012", "name": "Production"}]
+            ),
+            UserSummary(user=User(id="user2", username="jane.doe"), accounts=[]),
+        ]
+        expected = json.dumps(
+            [summary.to_dict() for summary in user_summaries],
+            ensure_ascii=False,
+            indent=2,
+        ).encode("utf-8")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(temp_dir)
+                ReportGenerator(output_prefix="fast").generate_json_report(
+                    user_summaries
+                )
+                with patch("src.report_generators.orjson", None):
+                    ReportGenerator(output_prefix="std").generate_json_report(
+                        user_summaries
+                    )
+
+                with open("fast.json", "rb") as fast, open("std.json", "rb") as std:
+                    assert fast.read() == expected
+                    assert std.read() == expected
+
+                ReportGenerator(output_prefix="empty").generate_json_report([])
+                with open("empty.json", "rb") as empty:
+                    assert empty.read() == b"[]"
+
+            finally:
+                os.chdir(original_cwd)
@@ -7,8 +7,17 @@ These tests verify utility functions work correctly without AWS connections.
 import json
 import os
 import tempfile
+from unittest.mock import patch
 
-from src.utils import format_timestamp, load_from_json, save_to_json, validate_email
+import pytest
+
+from src.utils import (
+    format_timestamp,
+    json_loads,
+    load_from_json,
+    save_to_json,
+    validate_email,
+)
 
 
 class TestUtilityFunctions:
@@ -71,6 +80,22 @@ class TestUtilityFunctions:
 
         assert result == []
 
+    def test_json_loads(self):
+        """Test json_loads parses JSON with and without orjson."""
+        document = '{"Statement": [{"Action": "s3:GetObject"}]}'
+
+        assert json_loads(document) == json.loads(document)
+        with patch("src.utils.orjson", None):
+            assert json_loads(document) == json.loads(document)
+
+    def test_json_loads_invalid(self):
+        """Test json_loads raises json.JSONDecodeError on invalid input."""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("{not json")
+        with patch("src.utils.orjson", None):
+            with pytest.raises(json.JSONDecodeError):
+                json_loads("{not json")
+
     def test_format_timestamp(self):
         """Test format_timestamp function."""
         from datetime import datetime